@@ -2,10 +2,11 @@ import logging
 import sys
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EVENT_HOMEASSISTANT_START
+from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant
 
-from .common.consts import DEFAULT_NAME, DOMAIN
+from .common.consts import DATA_FLEET_MANAGER, DEFAULT_NAME, DOMAIN
+from .managers.fleet_manager import FleetManager
 from .managers.ha_config_manager import HAConfigManager
 from .managers.ha_coordinator import HACoordinator
 
@@ -29,10 +30,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         is_initialized = config_manager.is_initialized
 
         if is_initialized:
-            coordinator = HACoordinator(hass, config_manager)
+            fleet_manager = _get_fleet_manager(hass) if config_manager.fleet else None
+
+            coordinator = HACoordinator(hass, config_manager, fleet_manager)
 
             hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
+            # Entities of the last session are available without waiting for the printer
+            await coordinator.warm_start()
+
+            entry.async_on_unload(
+                hass.bus.async_listen_once(
+                    EVENT_HOMEASSISTANT_STOP, coordinator.on_home_assistant_stop
+                )
+            )
+
             if hass.is_running:
                 await coordinator.initialize()
 
@@ -62,7 +74,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     coordinator: HACoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    await coordinator.config_manager.remove(entry.entry_id)
+    await coordinator.terminate()
 
     platforms = coordinator.config_manager.platforms
 
@@ -71,4 +83,29 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     del hass.data[DOMAIN][entry.entry_id]
 
+    fleet_manager: FleetManager | None = hass.data.get(DATA_FLEET_MANAGER)
+
+    if fleet_manager is not None and not fleet_manager.entries:
+        hass.data.pop(DATA_FLEET_MANAGER)
+
     return True
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """Remove the stored settings and devices snapshot of a deleted config entry."""
+    config_manager = HAConfigManager(hass, entry)
+
+    # Settings survive unloading, reloads apply the options
+    await config_manager.remove(entry.entry_id)
+    await config_manager.remove_snapshot()
+
+
+def _get_fleet_manager(hass: HomeAssistant) -> FleetManager:
+    fleet_manager: FleetManager | None = hass.data.get(DATA_FLEET_MANAGER)
+
+    if fleet_manager is None:
+        fleet_manager = FleetManager(hass)
+
+        hass.data[DATA_FLEET_MANAGER] = fleet_manager
+
+    return fleet_manager
@@ -38,17 +38,26 @@ class HABinarySensorEntity(BaseEntity, BinarySensorEntity):
         self._attr_device_class = entity_description.device_class
         self._entity_on_values = entity_description.on_values
 
+        self._state: str | None = None
+        self._attr_is_on = None
+        self._attr_extra_state_attributes = None
+
         self._set_value()
 
+        self._written_state = self._get_state()
+
     def _set_value(self):
         state = self.get_value()
 
+        if state == self._state and self._attr_is_on is not None:
+            return
+
+        self._state = state
+
         is_on = str(state).lower() in self._entity_on_values
 
         self._attr_is_on = is_on
         self._attr_extra_state_attributes = {ATTR_STATE: state}
 
-    def _handle_coordinator_update(self) -> None:
-        """Fetch new state parameters for the sensor."""
-        self._set_value()
-        super()._handle_coordinator_update()
+    def _get_state(self) -> tuple:
+        return *super()._get_state(), self._attr_is_on, self._state
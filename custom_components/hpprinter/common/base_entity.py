@@ -9,7 +9,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import slugify
 
 from ..managers.ha_coordinator import HACoordinator
-from .consts import DOMAIN, SIGNAL_HA_DEVICE_CREATED
+from .consts import ATTR_STALE, DOMAIN, SIGNAL_HA_DEVICES_CREATED
 from .entity_descriptions import IntegrationEntityDescription
 
 _LOGGER = logging.getLogger(__name__)
@@ -23,38 +23,69 @@ async def async_setup_base_entry(
     async_add_entities,
 ):
     @callback
-    def _async_handle_device(
-        entry_id: str, device_key: str, device_data: dict, device_config: dict
-    ):
+    def _async_handle_devices(entry_id: str, devices: dict[str, dict]):
         if entry.entry_id != entry_id:
             return
 
         coordinator: HACoordinator = hass.data[DOMAIN][entry.entry_id]
 
-        _async_handle_device_created(
+        _async_handle_devices_created(
             coordinator,
             platform,
             entity_type,
             async_add_entities,
-            device_key,
-            device_data,
-            device_config,
+            devices,
         )
 
     entry.async_on_unload(
-        async_dispatcher_connect(hass, SIGNAL_HA_DEVICE_CREATED, _async_handle_device)
+        async_dispatcher_connect(hass, SIGNAL_HA_DEVICES_CREATED, _async_handle_devices)
     )
 
 
-def _async_handle_device_created(
+def _async_handle_devices_created(
     coordinator: HACoordinator,
     platform: Platform,
     entity_type: type,
     async_add_entities,
+    devices: dict[str, dict],
+):
+    entities = []
+
+    for device_key in devices:
+        device = devices[device_key]
+
+        entities.extend(
+            _get_device_entities(
+                coordinator,
+                platform,
+                entity_type,
+                device_key,
+                device.get("data"),
+                device.get("config"),
+            )
+        )
+
+    entity_keys = [entity.unique_id for entity in entities]
+
+    entity_keys_str = ", ".join(entity_keys)
+
+    _LOGGER.debug(
+        f"Setting up {platform} {len(entities)} entities, Keys: {entity_keys_str}"
+    )
+
+    # Entities hold their state since creation, a refresh per entity is not needed
+    if entities:
+        async_add_entities(entities)
+
+
+def _get_device_entities(
+    coordinator: HACoordinator,
+    platform: Platform,
+    entity_type: type,
     device_key: str,
     device_data: dict,
     device_config: dict,
-):
+) -> list:
     entities = []
 
     device_type = device_config.get("device_type")
@@ -81,16 +112,7 @@ def _async_handle_device_created(
                 f"Error: {ex}, Line: {line_number}"
             )
 
-    entity_keys = [entity.unique_id for entity in entities]
-
-    entity_keys_str = ", ".join(entity_keys)
-
-    _LOGGER.debug(
-        f"Setting up {platform} {len(entities)} entities, Keys: {entity_keys_str}"
-    )
-
-    if entities:
-        async_add_entities(entities, True)
+    return entities
 
 
 class BaseEntity(CoordinatorEntity):
@@ -102,7 +124,8 @@ class BaseEntity(CoordinatorEntity):
         coordinator: HACoordinator,
         device_key: str,
     ):
-        super().__init__(coordinator)
+        # Coordinator notifies the entity only when its own value changed
+        super().__init__(coordinator, context=(device_key, entity_description.key))
 
         self.entity_description = entity_description
 
@@ -132,6 +155,47 @@ class BaseEntity(CoordinatorEntity):
         self._attr_unique_id = unique_id
         self._attr_icon = entity_description.icon
 
+        self._written_state: tuple | None = None
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+
+        self.local_coordinator.register_entity(self.entity_description)
+
+    async def async_will_remove_from_hass(self) -> None:
+        self.local_coordinator.unregister_entity(self.entity_description)
+
+        await super().async_will_remove_from_hass()
+
+    def _set_value(self):
+        pass
+
+    def _get_state(self) -> tuple:
+        return self.available, self.local_coordinator.is_stale
+
+    @property
+    def extra_state_attributes(self) -> dict | None:
+        attributes = super().extra_state_attributes
+
+        # Values restored from the last session until the printer responded
+        if self.local_coordinator.is_stale:
+            attributes = {**(attributes or {}), ATTR_STALE: True}
+
+        return attributes
+
+    def _handle_coordinator_update(self) -> None:
+        """Fetch new state parameters, write them only when changed."""
+        self._set_value()
+
+        state = self._get_state()
+
+        if state == self._written_state:
+            return
+
+        self._written_state = state
+
+        super()._handle_coordinator_update()
+
     @property
     def local_coordinator(self) -> HACoordinator:
         return self.coordinator
@@ -6,6 +6,8 @@ MANUFACTURER = "HP"
 DEFAULT_NAME = "HP Printer"
 DOMAIN = "hpprinter"
 DATA_HP_PRINTER = f"data_{DOMAIN}"
+DATA_FLEET_MANAGER = f"{DATA_HP_PRINTER}_fleet"
+DATA_SNAPSHOT_STORES = f"{DATA_HP_PRINTER}_snapshot_stores"
 
 INK_ICON = "mdi:cup-water"
 PAGES_ICON = "mdi:book-open-page-variant"
@@ -26,12 +28,20 @@ PRINTER_STATUS = {
 }
 
 PRINTER_MAIN_DEVICE = "Main"
+PRINTER_STATE_PROPERTY = "device_status"
+
+ATTR_STALE = "stale"
 
 IGNORED_KEYS = ["@schemaLocation", "Version"]
 
-SIGNAL_HA_DEVICE_CREATED = f"signal_{DOMAIN}_device_created"
-SIGNAL_HA_DEVICE_DISCOVERED = f"signal_{DOMAIN}_device_discovered"
+JSON_CONTENT_TYPE = "application/javascript"
+STREAM_CHUNK_SIZE = 4096
+
+SIGNAL_HA_DEVICES_CREATED = f"signal_{DOMAIN}_devices_created"
+SIGNAL_HA_DEVICES_DISCOVERED = f"signal_{DOMAIN}_devices_discovered"
 CONFIGURATION_FILE = f"{DOMAIN}.config.json"
+SNAPSHOT_FILE = f"{DOMAIN}.snapshot"
+SNAPSHOT_SAVE_DELAY = timedelta(minutes=1)
 LEGACY_KEY_FILE = f"{DOMAIN}.key"
 
 UPDATE_API_INTERVAL = timedelta(seconds=1)
@@ -52,12 +62,14 @@ MODEL_PROPERTY = "make_and_model"
 
 PRODUCT_STATUS_ENDPOINT = "/DevMgmt/ProductStatusDyn.xml"
 PRODUCT_MAIN_ENDPOINT = "/DevMgmt/ProductConfigDyn.xml"
+EVENT_TABLE_ENDPOINT = "/EventMgmt/EventTable"
 
 PRODUCT_STATUS_OFFLINE_PAYLOAD = {
     "ProductStatusDyn": {"Status": [{"StatusCategory": "off"}]}
 }
 
 DURATION_UNITS = {
+    "ms": "milliseconds",
     "s": "seconds",
     "m": "minutes",
     "h": "hours",
@@ -66,3 +78,48 @@ DURATION_UNITS = {
 }
 
 DEFAULT_INTERVAL = "5m"
+
+# Parameters derived from data_points.json, see utils/compile_data_points.py
+COMPILED_PARAMETERS_FILE = "data_points.compiled"
+COMPILED_PARAMETERS_VERSION = 3
+
+STORAGE_DATA_CONCURRENCY = "concurrency"
+STORAGE_DATA_UNSUPPORTED_ENDPOINTS = "unsupported_endpoints"
+STORAGE_DATA_STREAMING = "streaming"
+STORAGE_DATA_FULL_DOCUMENTS = "full_documents"
+STORAGE_DATA_PUSH = "push"
+STORAGE_DATA_FLEET = "fleet"
+
+DEFAULT_CONCURRENCY = 3
+DEFAULT_STREAMING = False
+DEFAULT_FULL_DOCUMENTS = False
+DEFAULT_PUSH = False
+DEFAULT_FLEET = False
+
+CONNECTION_KEEPALIVE_TIMEOUT = timedelta(seconds=30)
+CONNECTION_DNS_CACHE_TTL = timedelta(minutes=5)
+
+REQUEST_TIMEOUT = timedelta(seconds=5)
+REQUEST_TIMEOUT_MIN = timedelta(seconds=1)
+REQUEST_TIMEOUT_MAX = timedelta(seconds=30)
+REQUEST_TIMEOUT_FACTOR = 3
+REQUEST_TIMEOUT_PERCENTILE = 0.9
+REQUEST_LATENCY_SAMPLES = 50
+REQUEST_LATENCY_MIN_SAMPLES = 5
+
+CATCH_UP_WINDOW = timedelta(seconds=30)
+
+OFFLINE_PROBE_MAX_INTERVAL = timedelta(minutes=5)
+OFFLINE_PROBE_CONNECT_TIMEOUT = timedelta(seconds=2)
+
+EVENT_TABLE_LONG_POLL_TIMEOUT = timedelta(minutes=2)
+EVENT_TABLE_MIN_INTERVAL = timedelta(seconds=1)
+EVENT_TABLE_MAX_QUICK_REPLIES = 5
+EVENT_TABLE_SAFETY_INTERVAL = timedelta(minutes=30)
+
+FLEET_CONCURRENCY = 16
+FLEET_STATUS_CONCURRENCY = 4
+FLEET_SCHEDULER_RESOLUTION = timedelta(milliseconds=100)
+
+UNSUPPORTED_ENDPOINT_PROBE_INTERVAL = timedelta(hours=1)
+UNSUPPORTED_ENDPOINT_MAX_PROBE_INTERVAL = timedelta(weeks=1)
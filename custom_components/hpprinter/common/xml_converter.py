@@ -0,0 +1,133 @@
+from defusedxml import ElementTree
+from defusedxml.ElementTree import DefusedXMLParser
+
+ATTRIBUTE_PREFIX = "@"
+TEXT_KEY = "#text"
+
+
+class XmlDictConverter:
+    """Parser target building the xmltodict shape in a single pass, without namespaces.
+
+    Projection is a tree of element names to materialize, a None node keeps the
+    whole subtree, elements outside the projection are scanned but never built.
+    """
+
+    def __init__(
+        self, ignored_keys: list[str] | None = None, projection: dict | None = None
+    ):
+        self._ignored_keys = [] if ignored_keys is None else ignored_keys
+
+        self._stack: list[tuple[dict | None, list[str], dict | None]] = []
+        self._item: dict | None = None
+        self._data: list[str] = []
+        self._projection = projection
+        self._skip_depth = 0
+
+    @classmethod
+    def create_parser(
+        cls, ignored_keys: list[str] | None = None, projection: dict | None = None
+    ) -> DefusedXMLParser:
+        parser = ElementTree.XMLParser(target=cls(ignored_keys, projection))
+
+        return parser
+
+    @classmethod
+    def parse(
+        cls,
+        content: bytes,
+        ignored_keys: list[str] | None = None,
+        projection: dict | None = None,
+    ) -> dict:
+        parser = cls.create_parser(ignored_keys, projection)
+        parser.feed(content)
+
+        data = parser.close()
+
+        return data
+
+    @staticmethod
+    def _strip_namespace(name: str) -> str:
+        if name.startswith("{"):
+            name = name.split("}", 1)[1]
+
+        return name
+
+    @staticmethod
+    def _push_data(item: dict | None, key: str, data) -> dict:
+        if item is None:
+            item = {}
+
+        if key in item:
+            value = item[key]
+
+            if isinstance(value, list):
+                value.append(data)
+
+            else:
+                item[key] = [value, data]
+
+        else:
+            item[key] = data
+
+        return item
+
+    def start(self, tag: str, attrib: dict[str, str]):
+        if self._skip_depth > 0:
+            self._skip_depth += 1
+            return
+
+        projection = self._projection
+
+        if projection is not None:
+            name = self._strip_namespace(tag)
+
+            if name not in projection:
+                self._skip_depth = 1
+                return
+
+            projection = projection[name]
+
+        self._stack.append((self._item, self._data, self._projection))
+        self._projection = projection
+
+        item = {
+            f"{ATTRIBUTE_PREFIX}{self._strip_namespace(key)}": attrib[key]
+            for key in attrib
+        }
+
+        self._item = item or None
+        self._data = []
+
+    def data(self, data: str):
+        if self._skip_depth == 0:
+            self._data.append(data)
+
+    def end(self, tag: str):
+        if self._skip_depth > 0:
+            self._skip_depth -= 1
+            return
+
+        name = self._strip_namespace(tag)
+
+        data = "".join(self._data).strip() or None
+        item = self._item
+
+        self._item, self._data, self._projection = self._stack.pop()
+
+        if item is None:
+            value = data
+
+        else:
+            if data is not None:
+                item[TEXT_KEY] = data
+
+            value = item
+
+        if not self._stack and isinstance(value, dict):
+            for ignored_key in self._ignored_keys:
+                value.pop(ignored_key, None)
+
+        self._item = self._push_data(self._item, name, value)
+
+    def close(self) -> dict | None:
+        return self._item
@@ -20,18 +20,17 @@ async def async_get_config_entry_diagnostics(
     """Return diagnostics for a config entry."""
     _LOGGER.debug("Starting diagnostic tool")
 
-    return _async_get_diagnostics(hass, entry)
+    return await _async_get_diagnostics(hass, entry)
 
 
 async def async_get_device_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry, device: DeviceEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a device entry."""
-    return _async_get_diagnostics(hass, entry, device)
+    return await _async_get_diagnostics(hass, entry, device)
 
 
-@callback
-def _async_get_diagnostics(
+async def _async_get_diagnostics(
     hass: HomeAssistant,
     entry: ConfigEntry,
     device: DeviceEntry | None = None,
@@ -41,7 +40,7 @@ def _async_get_diagnostics(
 
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    debug_data = coordinator.get_debug_data()
+    debug_data = await coordinator.get_debug_data()
 
     data = {
         "disabled_by": entry.disabled_by,
@@ -0,0 +1,366 @@
+from collections import deque
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+import heapq
+import itertools
+import logging
+import time
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from ..common.consts import (
+    FLEET_CONCURRENCY,
+    FLEET_SCHEDULER_RESOLUTION,
+    FLEET_STATUS_CONCURRENCY,
+)
+from .rest_api import RestAPIv2
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FleetManager:
+    """Scheduler and request budget shared by the config entries of the process.
+
+    Printer updates of all entries are woken by a single timer, requests wait for
+    a slot of the global and the per printer limits, granted round-robin.
+    Status requests go first and may use a reserve on top of the global limit,
+    availability of the printers is not delayed by their endpoints.
+
+    Lanes stay with the coordinators, each one decides what its printer polls and
+    when, the fleet only owns the timer waking them and the request slots.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        concurrency: int = FLEET_CONCURRENCY,
+        status_concurrency: int = FLEET_STATUS_CONCURRENCY,
+    ):
+        self._hass = hass
+        self._concurrency = concurrency
+        self._status_concurrency = status_concurrency
+
+        self._apis: dict[str, RestAPIv2] = {}
+
+        self._schedule: list[tuple[float, int, list[Callable | None]]] = []
+        self._schedule_sequence = itertools.count()
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._timer_deadline: float | None = None
+
+        self._active_requests: dict[str, int] = {}
+        self._active_total = 0
+        self._waiters: dict[str, deque] = {}
+        self._waiting_hosts: deque[str] = deque()
+        self._status_waiters: deque = deque()
+
+        self._statistics: dict[str, float] = {
+            "wakeups": 0,
+            "actions": 0,
+            "requests": 0,
+            "queued_requests": 0,
+            "wait_time": 0,
+            "max_wait_time": 0,
+            "max_active_requests": 0,
+        }
+
+    @property
+    def entries(self) -> list[str]:
+        return list(self._apis.keys())
+
+    def register(self, entry_id: str, api: RestAPIv2):
+        self._apis[entry_id] = api
+
+        _LOGGER.debug(f"Entry {entry_id} joined the fleet, Printers: {len(self._apis)}")
+
+    def unregister(self, entry_id: str):
+        self._apis.pop(entry_id, None)
+
+        _LOGGER.debug(f"Entry {entry_id} left the fleet, Printers: {len(self._apis)}")
+
+        if not self._apis:
+            self._cancel_timer()
+
+            self._schedule.clear()
+
+    @callback
+    def async_call_later(self, delay: float, action: Callable) -> CALLBACK_TYPE:
+        """Same contract as `async_call_later`, all actions share one timer."""
+        deadline = time.monotonic() + delay
+
+        # Cancelled actions are cleared in place and skipped once they surface
+        item = [action]
+
+        heapq.heappush(self._schedule, (deadline, next(self._schedule_sequence), item))
+
+        if self._timer_deadline is None or deadline < self._timer_deadline:
+            self._set_timer(deadline)
+
+        @callback
+        def cancel() -> None:
+            item[0] = None
+
+        return cancel
+
+    def _set_timer(self, deadline: float):
+        self._cancel_timer()
+
+        self._timer_deadline = deadline
+
+        delay = max(deadline - time.monotonic(), 0)
+
+        self._unsub_timer = async_call_later(self._hass, delay, self._on_timer)
+
+    def _cancel_timer(self):
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+
+            self._unsub_timer = None
+
+        self._timer_deadline = None
+
+    @callback
+    def _on_timer(self, _now):
+        self._unsub_timer = None
+        self._timer_deadline = None
+
+        self._statistics["wakeups"] += 1
+
+        # Actions due within the resolution share the wakeup
+        due_time = time.monotonic() + FLEET_SCHEDULER_RESOLUTION.total_seconds()
+
+        actions = []
+
+        while self._schedule and self._schedule[0][0] <= due_time:
+            _deadline, _sequence, item = heapq.heappop(self._schedule)
+
+            if item[0] is not None:
+                actions.append(item[0])
+
+        while self._schedule and self._schedule[0][2][0] is None:
+            heapq.heappop(self._schedule)
+
+        if self._schedule:
+            self._set_timer(self._schedule[0][0])
+
+        now = dt_util.utcnow()
+
+        for action in actions:
+            self._statistics["actions"] += 1
+
+            action(now)
+
+    @asynccontextmanager
+    async def request_slot(
+        self, host: str, host_concurrency: int, is_status: bool = False
+    ):
+        """Holds a request slot of the fleet and the printer while requesting."""
+        start = time.monotonic()
+
+        await self._acquire(host, host_concurrency, is_status)
+
+        wait_time = time.monotonic() - start
+
+        self._statistics["requests"] += 1
+        self._statistics["wait_time"] += wait_time
+        self._statistics["max_wait_time"] = max(
+            self._statistics["max_wait_time"], wait_time
+        )
+
+        try:
+            yield
+
+        finally:
+            self._release(host)
+
+    def _can_acquire(
+        self, host: str, host_concurrency: int, is_status: bool = False
+    ) -> bool:
+        concurrency = self._concurrency
+
+        if is_status:
+            concurrency += self._status_concurrency
+
+        can_acquire = (
+            self._active_total < concurrency
+            and self._active_requests.get(host, 0) < host_concurrency
+        )
+
+        return can_acquire
+
+    async def _acquire(self, host: str, host_concurrency: int, is_status: bool):
+        # Queued printers keep their turn, newcomers do not overtake them
+        if is_status:
+            is_queued = len(self._status_waiters) > 0
+
+        else:
+            is_queued = host in self._waiters
+
+        if not is_queued and self._can_acquire(host, host_concurrency, is_status):
+            self._grant(host)
+
+            return
+
+        future = self._hass.loop.create_future()
+
+        if is_status:
+            self._status_waiters.append((future, host, host_concurrency))
+
+        else:
+            waiters = self._waiters.get(host)
+
+            if waiters is None:
+                waiters = deque()
+
+                self._waiters[host] = waiters
+                self._waiting_hosts.append(host)
+
+            waiters.append((future, host_concurrency))
+
+        self._statistics["queued_requests"] += 1
+
+        try:
+            await future
+
+        except BaseException:
+            if future.done() and not future.cancelled():
+                # Granted while being cancelled, the slot is passed on
+                self._release(host)
+
+            elif is_status:
+                self._remove_status_waiter(future)
+
+            else:
+                self._remove_waiter(host, future)
+
+            raise
+
+    def _grant(self, host: str):
+        self._active_requests[host] = self._active_requests.get(host, 0) + 1
+        self._active_total += 1
+
+        self._statistics["max_active_requests"] = max(
+            self._statistics["max_active_requests"], self._active_total
+        )
+
+    def _release(self, host: str):
+        self._active_requests[host] -= 1
+        self._active_total -= 1
+
+        if self._active_requests[host] == 0:
+            self._active_requests.pop(host)
+
+        self._wake_waiters()
+
+    def _remove_waiter(self, host: str, future):
+        waiters = self._waiters.get(host)
+
+        if waiters is None:
+            return
+
+        for waiter in waiters:
+            if waiter[0] is future:
+                waiters.remove(waiter)
+                break
+
+        if not waiters:
+            self._waiters.pop(host)
+            self._waiting_hosts.remove(host)
+
+    def _remove_status_waiter(self, future):
+        for waiter in self._status_waiters:
+            if waiter[0] is future:
+                self._status_waiters.remove(waiter)
+                break
+
+    def _wake_status_waiters(self):
+        for waiter in list(self._status_waiters):
+            future, host, host_concurrency = waiter
+
+            # Waiter cancelled before its task resumed
+            if future.done():
+                self._status_waiters.remove(waiter)
+
+                continue
+
+            if self._can_acquire(host, host_concurrency, True):
+                self._status_waiters.remove(waiter)
+
+                self._grant(host)
+
+                future.set_result(None)
+
+    def _wake_waiters(self):
+        self._wake_status_waiters()
+
+        skipped_hosts = 0
+
+        # Round-robin between printers, each turn grants one request of a printer
+        while (
+            self._waiting_hosts
+            and self._active_total < self._concurrency
+            and skipped_hosts < len(self._waiting_hosts)
+        ):
+            host = self._waiting_hosts[0]
+            waiters = self._waiters[host]
+
+            future, host_concurrency = waiters[0]
+
+            # Waiter cancelled before its task resumed
+            if future.done():
+                self._remove_waiter(host, future)
+
+                continue
+
+            if not self._can_acquire(host, host_concurrency):
+                self._waiting_hosts.rotate(-1)
+
+                skipped_hosts += 1
+
+                continue
+
+            waiters.popleft()
+
+            if waiters:
+                self._waiting_hosts.rotate(-1)
+
+            else:
+                self._waiters.pop(host)
+                self._waiting_hosts.popleft()
+
+            skipped_hosts = 0
+
+            self._grant(host)
+
+            future.set_result(None)
+
+    def get_debug_data(self) -> dict:
+        statistics = self._statistics
+        requests = statistics["requests"]
+
+        average_wait_time = 0 if requests == 0 else statistics["wait_time"] / requests
+
+        data = {
+            "printers": len(self._apis),
+            "online": len([api for api in self._apis.values() if api.is_online]),
+            "concurrency": self._concurrency,
+            "status_concurrency": self._status_concurrency,
+            "scheduler": {
+                "scheduled": len(self._schedule),
+                "wakeups": statistics["wakeups"],
+                "actions": statistics["actions"],
+            },
+            "requests": {
+                "active": self._active_total,
+                "waiting": sum(len(waiters) for waiters in self._waiters.values())
+                + len(self._status_waiters),
+                "total": requests,
+                "queued": statistics["queued_requests"],
+                "max_active": statistics["max_active_requests"],
+                "average_wait_time": round(average_wait_time, 3),
+                "max_wait_time": round(statistics["max_wait_time"], 3),
+            },
+        }
+
+        return data
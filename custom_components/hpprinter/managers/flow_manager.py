@@ -5,6 +5,8 @@ from copy import copy
 import logging
 from typing import Any
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowHandler
@@ -12,9 +14,15 @@ from homeassistant.data_entry_flow import FlowHandler
 from ..common.consts import (
     DATA_KEYS,
     DEFAULT_NAME,
+    DOMAIN,
     MODEL_PROPERTY,
     PRINTER_MAIN_DEVICE,
     PRODUCT_MAIN_ENDPOINT,
+    STORAGE_DATA_CONCURRENCY,
+    STORAGE_DATA_FLEET,
+    STORAGE_DATA_FULL_DOCUMENTS,
+    STORAGE_DATA_PUSH,
+    STORAGE_DATA_STREAMING,
 )
 from ..models.config_data import ConfigData
 from .ha_config_manager import HAConfigManager
@@ -57,7 +65,13 @@ class IntegrationFlowManager:
             else:
                 user_input = {key: self._entry.data[key] for key in self._entry.data}
 
+                entry_config_manager = await self._get_entry_config_manager()
+
+                user_input.update(entry_config_manager.get_options())
+
         else:
+            api: RestAPIv2 | None = None
+
             try:
                 await self._config_manager.initialize(user_input)
 
@@ -78,9 +92,27 @@ class IntegrationFlowManager:
                         data = copy(user_input)
 
                     else:
-                        data = await self.remap_entry_data(user_input)
+                        entry_config_manager = await self._get_entry_config_manager()
+
+                        # Stored with the entry settings, not as entry options
+                        option_keys = entry_config_manager.get_options()
+
+                        await entry_config_manager.set_options(user_input)
+
+                        entry_input = {
+                            key: user_input[key]
+                            for key in user_input
+                            if key not in option_keys
+                        }
+
+                        data = await self.remap_entry_data(entry_input)
                         title = self._entry.title
 
+                        # Options are applied by setting up the entry again
+                        self._hass.async_create_task(
+                            self._hass.config_entries.async_reload(self._entry.entry_id)
+                        )
+
                     return self._flow_handler.async_create_entry(title=title, data=data)
 
                 else:
@@ -93,12 +125,57 @@ class IntegrationFlowManager:
 
                 _LOGGER.error(f"Failed to setup integration, Error: {ex}")
 
+            finally:
+                if api is not None:
+                    await api.terminate()
+
         schema = ConfigData.default_schema(user_input)
 
+        if self._entry is not None:
+            schema = schema.extend(self._get_options_schema(user_input))
+
         return self._flow_handler.async_show_form(
             step_id=self._flow_id, data_schema=schema, errors=form_errors
         )
 
+    async def _get_entry_config_manager(self) -> HAConfigManager:
+        coordinator = self._hass.data.get(DOMAIN, {}).get(self._entry.entry_id)
+
+        # Running entries share their manager, changes apply to its storage
+        if coordinator is not None:
+            return coordinator.config_manager
+
+        entry_config = {key: self._entry.data[key] for key in self._entry.data}
+
+        config_manager = HAConfigManager(self._hass, self._entry)
+        await config_manager.initialize(entry_config)
+
+        return config_manager
+
+    @staticmethod
+    def _get_options_schema(user_input: dict) -> dict:
+        options_schema = {
+            vol.Optional(
+                STORAGE_DATA_PUSH, default=user_input.get(STORAGE_DATA_PUSH)
+            ): bool,
+            vol.Optional(
+                STORAGE_DATA_CONCURRENCY,
+                default=user_input.get(STORAGE_DATA_CONCURRENCY),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+            vol.Optional(
+                STORAGE_DATA_STREAMING, default=user_input.get(STORAGE_DATA_STREAMING)
+            ): bool,
+            vol.Optional(
+                STORAGE_DATA_FULL_DOCUMENTS,
+                default=user_input.get(STORAGE_DATA_FULL_DOCUMENTS),
+            ): bool,
+            vol.Optional(
+                STORAGE_DATA_FLEET, default=user_input.get(STORAGE_DATA_FLEET)
+            ): bool,
+        }
+
+        return options_schema
+
     async def remap_entry_data(self, options: dict[str, Any]) -> dict[str, Any]:
         config_options = {}
         config_data = {}
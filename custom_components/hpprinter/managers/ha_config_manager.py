@@ -1,10 +1,16 @@
+import asyncio
+from collections.abc import Mapping, Sequence
 from datetime import timedelta
+import hashlib
 import json
 import logging
 import os
 from pathlib import Path
+import sys
+from types import MappingProxyType
 
 import aiofiles
+import aiofiles.os
 
 from homeassistant.config_entries import STORAGE_VERSION, ConfigEntry
 from homeassistant.const import Platform
@@ -15,12 +21,30 @@ from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.storage import Store
 
 from ..common.consts import (
+    COMPILED_PARAMETERS_FILE,
+    COMPILED_PARAMETERS_VERSION,
     CONFIGURATION_FILE,
+    DATA_SNAPSHOT_STORES,
+    DEFAULT_CONCURRENCY,
     DEFAULT_ENTRY_ID,
+    DEFAULT_FLEET,
+    DEFAULT_FULL_DOCUMENTS,
     DEFAULT_INTERVAL,
     DEFAULT_NAME,
+    DEFAULT_PUSH,
+    DEFAULT_STREAMING,
     DOMAIN,
     DURATION_UNITS,
+    SNAPSHOT_FILE,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_DATA_CONCURRENCY,
+    STORAGE_DATA_FLEET,
+    STORAGE_DATA_FULL_DOCUMENTS,
+    STORAGE_DATA_PUSH,
+    STORAGE_DATA_STREAMING,
+    STORAGE_DATA_UNSUPPORTED_ENDPOINTS,
+    UNSUPPORTED_ENDPOINT_MAX_PROBE_INTERVAL,
+    UNSUPPORTED_ENDPOINT_PROBE_INTERVAL,
 )
 from ..common.entity_descriptions import (
     IntegrationBinarySensorEntityDescription,
@@ -34,19 +58,34 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class HAConfigManager:
+    # Configuration derived from the parameter files, shared read-only by all entries
+    _parameters_configuration: dict | None = None
+    _parameters_lock: asyncio.Lock | None = None
+    _parameters_lock_loop: asyncio.AbstractEventLoop | None = None
+    # Translated entity names per language, shared by all entries
+    _entity_names_cache: dict | None = None
+
     _translations: dict | None
     _entry: ConfigEntry | None
     _entry_id: str
     _entry_title: str
     _config_data: ConfigData
     _store: Store | None
-    _update_intervals: dict[str, int] | None
-    _data_points: dict | None
-    _endpoints: list[str] | None
-    _exclude_uri_list: list[str] | None
-    _exclude_type_list: list[str] | None
-    _entity_descriptions: list[IntegrationEntityDescription] | None
-    _minimum_update_interval: timedelta
+    _snapshot_store: Store | None
+    _snapshot: dict | None
+    _update_intervals: Mapping[str, float] | None
+    _update_profiles: Mapping[str, dict[str, float | None]] | None
+    _data_points: Sequence[dict] | None
+    _extraction_plan: Sequence[dict] | None
+    _endpoint_projections: Mapping[str, dict] | None
+    _endpoints: Sequence[str] | None
+    _exclude_uri_list: Sequence[str] | None
+    _exclude_type_list: Sequence[str] | None
+    _entity_descriptions: Sequence[IntegrationEntityDescription] | None
+    _entity_endpoints: Mapping[tuple[str, str], str] | None
+    _entity_plans: Mapping[tuple[str, str], list[tuple]] | None
+    _entity_names: Mapping[tuple[str, str], str] | None
+    _entity_names_language: str | None
 
     def __init__(self, hass: HomeAssistant | None, entry: ConfigEntry | None):
         self._hass = hass
@@ -55,6 +94,10 @@ class HAConfigManager:
         self.platforms = []
 
         self._entity_descriptions = None
+        self._entity_endpoints = None
+        self._entity_plans = None
+        self._entity_names = None
+        self._entity_names_language = None
 
         self._translations = None
 
@@ -63,8 +106,10 @@ class HAConfigManager:
         self._default_update_interval = self._convert_to_seconds(DEFAULT_INTERVAL)
 
         self._update_intervals = None
-        self._minimum_update_interval = timedelta(seconds=self._default_update_interval)
+        self._update_profiles = None
         self._data_points = None
+        self._extraction_plan = None
+        self._endpoint_projections = None
         self._exclude_uri_list = None
         self._exclude_type_list = None
 
@@ -76,12 +121,19 @@ class HAConfigManager:
 
         self._is_initialized = False
         self._store = None
+        self._snapshot_store = None
+        self._snapshot = None
+        self._is_snapshot_save_pending = False
 
         if hass is not None:
             self._store = Store(
                 hass, STORAGE_VERSION, CONFIGURATION_FILE, encoder=JSONEncoder
             )
 
+        # Stored per entry, snapshots are saved often and must not race
+        if hass is not None and entry is not None:
+            self._snapshot_store = self._get_snapshot_store(hass, self._entry_id)
+
     @property
     def is_initialized(self) -> bool:
         is_initialized = self._is_initialized
@@ -100,10 +152,6 @@ class HAConfigManager:
 
         return entry_title
 
-    @property
-    def minimum_update_interval(self) -> timedelta:
-        return self._minimum_update_interval
-
     @property
     def entry(self) -> ConfigEntry:
         entry = self._entry
@@ -117,31 +165,66 @@ class HAConfigManager:
         return config_data
 
     @property
-    def endpoints(self) -> list[str] | None:
+    def endpoints(self) -> Sequence[str] | None:
         endpoints = self._endpoints
 
         return endpoints
 
     @property
-    def data_points(self) -> dict | None:
+    def data_points(self) -> Sequence[dict] | None:
         data_points = self._data_points
 
         return data_points
 
+    @property
+    def extraction_plan(self) -> Sequence[dict] | None:
+        extraction_plan = self._extraction_plan
+
+        return extraction_plan
+
+    @property
+    def concurrency(self) -> int:
+        concurrency = self._data.get(STORAGE_DATA_CONCURRENCY, DEFAULT_CONCURRENCY)
+
+        return max(1, int(concurrency))
+
+    @property
+    def streaming(self) -> bool:
+        streaming = self._data.get(STORAGE_DATA_STREAMING, DEFAULT_STREAMING)
+
+        return streaming
+
+    @property
+    def full_documents(self) -> bool:
+        full_documents = self._data.get(
+            STORAGE_DATA_FULL_DOCUMENTS, DEFAULT_FULL_DOCUMENTS
+        )
+
+        return full_documents
+
+    @property
+    def push(self) -> bool:
+        push = self._data.get(STORAGE_DATA_PUSH, DEFAULT_PUSH)
+
+        return push
+
+    @property
+    def fleet(self) -> bool:
+        fleet = self._data.get(STORAGE_DATA_FLEET, DEFAULT_FLEET)
+
+        return fleet
+
     async def initialize(self, entry_config: dict):
         await self._load()
 
         self._config_data.update(entry_config)
 
-        await self._load_exclude_endpoints_configuration()
-        await self._load_data_points_configuration()
-
-        self._load_entity_descriptions()
+        await self._load_parameters_configuration()
 
         if self._hass:
-            self._translations = await translation.async_get_translations(
-                self._hass, self._hass.config.language, "entity", {DOMAIN}
-            )
+            language = self._hass.config.language
+
+            await self._load_entity_names(language)
 
         self._is_initialized = True
 
@@ -166,39 +249,278 @@ class HAConfigManager:
             if should_save:
                 await self._store.async_save(data)
 
+    def get_options(self) -> dict:
+        options = {
+            STORAGE_DATA_PUSH: self.push,
+            STORAGE_DATA_FLEET: self.fleet,
+            STORAGE_DATA_FULL_DOCUMENTS: self.full_documents,
+            STORAGE_DATA_STREAMING: self.streaming,
+            STORAGE_DATA_CONCURRENCY: self.concurrency,
+        }
+
+        return options
+
+    async def set_options(self, options: dict):
+        for key in self.get_options():
+            if key in options:
+                self._data[key] = options[key]
+
+        await self._save()
+
+    async def set_concurrency(self, concurrency: int):
+        self._data[STORAGE_DATA_CONCURRENCY] = concurrency
+
+        await self._save()
+
+    async def set_streaming(self, streaming: bool):
+        self._data[STORAGE_DATA_STREAMING] = streaming
+
+        await self._save()
+
+    async def set_full_documents(self, full_documents: bool):
+        self._data[STORAGE_DATA_FULL_DOCUMENTS] = full_documents
+
+        await self._save()
+
+    async def set_push(self, push: bool):
+        self._data[STORAGE_DATA_PUSH] = push
+
+        await self._save()
+
+    async def set_fleet(self, fleet: bool):
+        self._data[STORAGE_DATA_FLEET] = fleet
+
+        await self._save()
+
+    async def get_snapshot(self) -> dict | None:
+        if self._snapshot_store is None:
+            return None
+
+        try:
+            snapshot = await self._snapshot_store.async_load()
+
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.warning(
+                f"Failed to load devices snapshot, Error: {ex}, Line: {line_number}"
+            )
+
+            snapshot = None
+
+        return snapshot
+
+    def set_snapshot(self, snapshot: dict):
+        self._snapshot = snapshot
+
+        if self._snapshot_store is None or self._is_snapshot_save_pending:
+            return
+
+        # Saves are coalesced, the latest snapshot is written once the delay passed
+        self._is_snapshot_save_pending = True
+
+        self._snapshot_store.async_delay_save(
+            self._get_snapshot_data, SNAPSHOT_SAVE_DELAY.total_seconds()
+        )
+
+    def _get_snapshot_data(self) -> dict:
+        self._is_snapshot_save_pending = False
+
+        return self._snapshot
+
+    async def flush_snapshot(self):
+        """Write a snapshot waiting for the save delay, the delayed save is cancelled."""
+        if self._snapshot_store is None or not self._is_snapshot_save_pending:
+            return
+
+        await self._snapshot_store.async_save(self._get_snapshot_data())
+
+    async def remove_snapshot(self):
+        if self._snapshot_store is None:
+            return
+
+        self._is_snapshot_save_pending = False
+
+        # Cancels a delayed save of the same store, it would write the file again
+        await self._snapshot_store.async_remove()
+
+        self._hass.data.get(DATA_SNAPSHOT_STORES, {}).pop(self._entry_id, None)
+
+    @staticmethod
+    def _get_snapshot_store(hass, entry_id: str) -> Store:
+        # Instances of an entry share the store, removal reaches pending saves
+        snapshot_stores = hass.data.setdefault(DATA_SNAPSHOT_STORES, {})
+
+        snapshot_store = snapshot_stores.get(entry_id)
+
+        if snapshot_store is None:
+            snapshot_store = Store(
+                hass,
+                STORAGE_VERSION,
+                f"{SNAPSHOT_FILE}.{entry_id}",
+                encoder=JSONEncoder,
+            )
+
+            snapshot_stores[entry_id] = snapshot_store
+
+        return snapshot_store
+
+    def _get_unsupported_endpoints(self) -> dict[str, dict]:
+        unsupported_endpoints = self._data.get(STORAGE_DATA_UNSUPPORTED_ENDPOINTS, {})
+        hostname = self._config_data.hostname
+
+        host_unsupported_endpoints = unsupported_endpoints.get(hostname, {})
+
+        return host_unsupported_endpoints
+
+    def is_endpoint_unsupported(self, endpoint: str, now_ts: float) -> bool:
+        unsupported_endpoint = self._get_unsupported_endpoints().get(endpoint)
+
+        is_unsupported = (
+            unsupported_endpoint is not None
+            and now_ts < unsupported_endpoint.get("next_probe", 0)
+        )
+
+        return is_unsupported
+
+    async def set_endpoint_unsupported(self, endpoint: str, now_ts: float):
+        unsupported_endpoints = self._data.get(STORAGE_DATA_UNSUPPORTED_ENDPOINTS, {})
+        hostname = self._config_data.hostname
+
+        host_unsupported_endpoints = dict(self._get_unsupported_endpoints())
+        unsupported_endpoint = host_unsupported_endpoints.get(endpoint, {})
+
+        failures = unsupported_endpoint.get("failures", 0) + 1
+
+        probe_interval = min(
+            UNSUPPORTED_ENDPOINT_PROBE_INTERVAL.total_seconds() * 2 ** (failures - 1),
+            UNSUPPORTED_ENDPOINT_MAX_PROBE_INTERVAL.total_seconds(),
+        )
+
+        host_unsupported_endpoints[endpoint] = {
+            "failures": failures,
+            "next_probe": now_ts + probe_interval,
+        }
+
+        _LOGGER.info(
+            f"Endpoint {endpoint} is not supported by {hostname}, "
+            f"Failures: {failures}, "
+            f"Next probe in: {timedelta(seconds=probe_interval)}"
+        )
+
+        self._data[STORAGE_DATA_UNSUPPORTED_ENDPOINTS] = {
+            **unsupported_endpoints,
+            hostname: host_unsupported_endpoints,
+        }
+
+        await self._save()
+
+    async def set_endpoint_supported(self, endpoint: str):
+        unsupported_endpoints = self._data.get(STORAGE_DATA_UNSUPPORTED_ENDPOINTS, {})
+        hostname = self._config_data.hostname
+
+        host_unsupported_endpoints = self._get_unsupported_endpoints()
+
+        if endpoint in host_unsupported_endpoints:
+            _LOGGER.info(f"Endpoint {endpoint} is supported by {hostname}")
+
+            self._data[STORAGE_DATA_UNSUPPORTED_ENDPOINTS] = {
+                **unsupported_endpoints,
+                hostname: {
+                    key: host_unsupported_endpoints[key]
+                    for key in host_unsupported_endpoints
+                    if key != endpoint
+                },
+            }
+
+            await self._save()
+
     def get_entity_name(
         self, entity_description: IntegrationEntityDescription, device_info: DeviceInfo
     ) -> str:
-        translation_key = entity_description.translation_key
-        platform = entity_description.platform
-
         device_name = device_info.get("name")
-        translation_key = f"component.{DOMAIN}.entity.{platform}.{translation_key}.name"
 
-        translated_name = self._translations.get(
-            translation_key, entity_description.name
+        name_key = (entity_description.platform, entity_description.translation_key)
+
+        translated_name = (
+            entity_description.name
+            if self._entity_names is None
+            else self._entity_names.get(name_key, entity_description.name)
         )
 
-        if translated_name is None or translated_name == "":
-            entity_name = f"{device_name} {entity_description.name}"
+        entity_name = f"{device_name} {translated_name}"
 
-            _LOGGER.warning(
-                f"Translations not found, "
-                f"Key: {translation_key}, "
-                f"Entity: {entity_description.name}"
+        return entity_name
+
+    async def _load_entity_names(self, language: str):
+        if language == self._entity_names_language:
+            return
+
+        cached_entity_names = HAConfigManager._entity_names_cache
+
+        # Reloaded parameters come with new entity descriptions
+        if (
+            cached_entity_names is None
+            or cached_entity_names.get("entity_descriptions")
+            is not self._entity_descriptions
+        ):
+            cached_entity_names = {
+                "entity_descriptions": self._entity_descriptions,
+                "languages": {},
+            }
+
+            HAConfigManager._entity_names_cache = cached_entity_names
+
+        entity_names = cached_entity_names["languages"].get(language)
+
+        if entity_names is None:
+            self._translations = await translation.async_get_translations(
+                self._hass, language, "entity", {DOMAIN}
             )
 
-        else:
-            entity_name = f"{device_name} {translated_name}"
+            entity_names = MappingProxyType(self._get_entity_names(language))
 
-            _LOGGER.debug(
-                f"Translations requested, "
-                f"Key: {translation_key}, "
-                f"Entity: {entity_description.name}, "
-                f"Value: {translated_name}"
+            cached_entity_names["languages"][language] = entity_names
+
+        self._entity_names = entity_names
+        self._entity_names_language = language
+
+    def _get_entity_names(self, language: str) -> dict[tuple[str, str], str]:
+        entity_names = {}
+
+        for entity_description in self._entity_descriptions:
+            platform = entity_description.platform
+            translation_key = entity_description.translation_key
+
+            name_key = (platform, translation_key)
+
+            translation_path = (
+                f"component.{DOMAIN}.entity.{platform}.{translation_key}.name"
             )
 
-        return entity_name
+            translated_name = self._translations.get(
+                translation_path, entity_description.name
+            )
+
+            if translated_name is None or translated_name == "":
+                translated_name = entity_description.name
+
+                _LOGGER.warning(
+                    f"Translations not found, "
+                    f"Key: {translation_path}, "
+                    f"Entity: {entity_description.name}"
+                )
+
+            entity_names[name_key] = translated_name
+
+        _LOGGER.debug(
+            f"Entity names loaded, "
+            f"Language: {language}, "
+            f"Names: {len(entity_names)}"
+        )
+
+        return entity_names
 
     def get_debug_data(self) -> dict:
         data = self._config_data.to_dict()
@@ -235,7 +557,14 @@ class HAConfigManager:
 
     @staticmethod
     def _get_defaults() -> dict:
-        data = {}
+        data = {
+            STORAGE_DATA_CONCURRENCY: DEFAULT_CONCURRENCY,
+            STORAGE_DATA_STREAMING: DEFAULT_STREAMING,
+            STORAGE_DATA_FULL_DOCUMENTS: DEFAULT_FULL_DOCUMENTS,
+            STORAGE_DATA_PUSH: DEFAULT_PUSH,
+            STORAGE_DATA_FLEET: DEFAULT_FLEET,
+            STORAGE_DATA_UNSUPPORTED_ENDPOINTS: {},
+        }
 
         return data
 
@@ -275,63 +604,80 @@ class HAConfigManager:
 
             await self._store.async_save(store_data)
 
-    def _load_entity_descriptions(self):
+    def _load_entity_descriptions(self, compiled_entity_descriptions: list[dict]):
         self._entity_descriptions = []
+        self._entity_endpoints = {}
+
+        for compiled_entity_description in compiled_entity_descriptions:
+            property_platform = compiled_entity_description.get("platform")
+            property_key = compiled_entity_description.get("key")
+            device_type = compiled_entity_description.get("device_type")
+            endpoint = compiled_entity_description.get("endpoint")
+
+            self._entity_endpoints[(device_type, property_key)] = endpoint
+
+            if property_platform == str(Platform.BINARY_SENSOR):
+                entity_description = IntegrationBinarySensorEntityDescription(
+                    key=property_key,
+                    name=property_key,
+                    device_type=device_type,
+                    exclude=compiled_entity_description.get("exclude"),
+                    on_values=compiled_entity_description.get("on_values"),
+                    device_class=compiled_entity_description.get("device_class"),
+                    icon=compiled_entity_description.get("icon"),
+                    translation_key=property_key,
+                )
 
-        for data_point in self._data_points:
-            device_type = data_point.get("device_type")
-            properties = data_point.get("properties")
+                self._entity_descriptions.append(entity_description)
+
+            elif property_platform == str(Platform.SENSOR):
+                entity_description = IntegrationSensorEntityDescription(
+                    key=property_key,
+                    name=property_key,
+                    device_type=device_type,
+                    exclude=compiled_entity_description.get("exclude"),
+                    native_unit_of_measurement=compiled_entity_description.get(
+                        "unit_of_measurement"
+                    ),
+                    device_class=compiled_entity_description.get("device_class"),
+                    icon=compiled_entity_description.get("icon"),
+                    translation_key=property_key,
+                    options=compiled_entity_description.get("options"),
+                    state_class=compiled_entity_description.get("state_class"),
+                )
 
-            for property_key in properties:
-                property_data = properties[property_key]
+                self._entity_descriptions.append(entity_description)
 
-                if "platform" in property_data:
-                    property_platform = property_data.get("platform")
-                    exclude = property_data.get("exclude")
-                    device_class = property_data.get("device_class")
-                    icon = property_data.get("icon")
-                    translation_key = property_key
-
-                    if property_platform == str(Platform.BINARY_SENSOR):
-                        on_values = [
-                            value.lower()
-                            for value in property_data.get("on_values", [])
-                        ]
-
-                        entity_description = IntegrationBinarySensorEntityDescription(
-                            key=property_key,
-                            name=property_key,
-                            device_type=device_type,
-                            exclude=exclude,
-                            on_values=on_values,
-                            device_class=device_class,
-                            icon=icon,
-                            translation_key=translation_key,
-                        )
-
-                        self._entity_descriptions.append(entity_description)
-
-                    elif property_platform == str(Platform.SENSOR):
-                        state_class = property_data.get("state_class")
-                        unit_of_measurement = property_data.get("unit_of_measurement")
-                        options = property_data.get("options")
-
-                        entity_description = IntegrationSensorEntityDescription(
-                            key=property_key,
-                            name=property_key,
-                            device_type=device_type,
-                            exclude=exclude,
-                            native_unit_of_measurement=unit_of_measurement,
-                            device_class=device_class,
-                            icon=icon,
-                            translation_key=translation_key,
-                            options=options,
-                            state_class=state_class,
-                        )
-
-                        self._entity_descriptions.append(entity_description)
+        self._load_entity_plans()
 
-        self._update_platforms()
+    def _load_entity_plans(self):
+        self._entity_plans = {}
+
+        for entity_description in self._entity_descriptions:
+            plan_key = (entity_description.platform, entity_description.device_type)
+
+            entity_plans = self._entity_plans.setdefault(plan_key, [])
+
+            exclude = self._compile_exclude(entity_description.exclude)
+
+            entity_plans.append((entity_description, exclude))
+
+    @staticmethod
+    def _compile_exclude(exclude: dict | None) -> tuple[tuple[str, list], ...]:
+        if not exclude:
+            return ()
+
+        compiled_exclude = tuple(
+            (
+                exclude_key,
+                exclude[exclude_key]
+                if isinstance(exclude[exclude_key], list)
+                else [exclude[exclude_key]],
+            )
+            for exclude_key in exclude
+        )
+
+        return compiled_exclude
 
     def _update_platforms(self):
         for entity_description in self._entity_descriptions:
@@ -341,111 +687,555 @@ class HAConfigManager:
             ):
                 self.platforms.append(entity_description.platform)
 
+    def get_entity_endpoint(
+        self, entity_description: IntegrationEntityDescription
+    ) -> str | None:
+        entity_key = (entity_description.device_type, entity_description.key)
+
+        endpoint = self._entity_endpoints.get(entity_key)
+
+        return endpoint
+
     def get_entity_descriptions(
         self, platform: Platform, device_type: str, device_data: dict
     ) -> list[IntegrationEntityDescription]:
+        entity_plans = self._entity_plans.get((platform, device_type), [])
+
         entity_descriptions = [
             entity_description
-            for entity_description in self._entity_descriptions
-            if self._is_valid_entity(
-                entity_description, device_data, device_type, platform
-            )
+            for entity_description, exclude in entity_plans
+            if entity_description.key in device_data
+            and not self._is_excluded(exclude, device_data)
         ]
 
         return entity_descriptions
 
     @staticmethod
-    def _is_valid_entity(
-        entity_description: IntegrationEntityDescription,
-        data: dict,
-        device_type: str,
-        platform: Platform,
+    def _is_excluded(exclude: tuple[tuple[str, list], ...], data: dict) -> bool:
+        is_excluded = any(
+            data.get(exclude_key) in exclude_values
+            for exclude_key, exclude_values in exclude
+        )
+
+        return is_excluded
+
+    @staticmethod
+    def _get_parameters_lock() -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+
+        # Created on first use, a lock is bound to the event loop it is used in
+        if (
+            HAConfigManager._parameters_lock is None
+            or HAConfigManager._parameters_lock_loop is not loop
+        ):
+            HAConfigManager._parameters_lock = asyncio.Lock()
+            HAConfigManager._parameters_lock_loop = loop
+
+        return HAConfigManager._parameters_lock
+
+    async def _load_parameters_configuration(self):
+        async with self._get_parameters_lock():
+            parameters_stats = {
+                parameter_type: await self._get_parameters_stat(parameter_type)
+                for parameter_type in [*ParameterType, COMPILED_PARAMETERS_FILE]
+            }
+
+            parameters_key = tuple(parameters_stats.values())
+
+            cached_configuration = HAConfigManager._parameters_configuration
+
+            if (
+                cached_configuration is not None
+                and cached_configuration.get("key") == parameters_key
+            ):
+                self._set_parameters_configuration(
+                    cached_configuration.get("configuration")
+                )
+
+                return
+
+            compiled_parameters = await self._get_compiled_parameters(parameters_stats)
+
+            self._load_compiled_parameters(compiled_parameters)
+
+            configuration = self._get_parameters_configuration()
+
+            # Instances share the cached objects, the new ones are used as well
+            self._set_parameters_configuration(configuration)
+
+            HAConfigManager._parameters_configuration = {
+                "key": parameters_key,
+                "configuration": configuration,
+            }
+
+            _LOGGER.debug(f"Parameters loaded, Modified: {parameters_key}")
+
+    def _get_parameters_configuration(self) -> dict:
+        configuration = {
+            "exclude_uri_list": tuple(self._exclude_uri_list),
+            "exclude_type_list": tuple(self._exclude_type_list),
+            "data_points": tuple(self._data_points),
+            "update_intervals": MappingProxyType(self._update_intervals),
+            "update_profiles": MappingProxyType(self._update_profiles),
+            "endpoints": tuple(self._endpoints),
+            "extraction_plan": tuple(self._extraction_plan),
+            "endpoint_projections": MappingProxyType(self._endpoint_projections),
+            "entity_descriptions": tuple(self._entity_descriptions),
+            "entity_endpoints": MappingProxyType(self._entity_endpoints),
+            "entity_plans": MappingProxyType(self._entity_plans),
+        }
+
+        return configuration
+
+    def _set_parameters_configuration(self, configuration: dict):
+        self._exclude_uri_list = configuration.get("exclude_uri_list")
+        self._exclude_type_list = configuration.get("exclude_type_list")
+        self._data_points = configuration.get("data_points")
+        self._update_intervals = configuration.get("update_intervals")
+        self._update_profiles = configuration.get("update_profiles")
+        self._endpoints = configuration.get("endpoints")
+        self._extraction_plan = configuration.get("extraction_plan")
+        self._endpoint_projections = configuration.get("endpoint_projections")
+        self._entity_descriptions = configuration.get("entity_descriptions")
+        self._entity_endpoints = configuration.get("entity_endpoints")
+        self._entity_plans = configuration.get("entity_plans")
+
+        self._update_platforms()
+
+    async def _get_compiled_parameters(self, parameters_stats: dict) -> dict:
+        compiled_parameters = await self._get_compiled_parameters_file()
+
+        if (
+            compiled_parameters is not None
+            and compiled_parameters.get("version") == COMPILED_PARAMETERS_VERSION
+        ):
+            if self._is_compiled_parameters_current(
+                compiled_parameters, parameters_stats
+            ):
+                _LOGGER.debug(
+                    f"Compiled parameters loaded, "
+                    f"Source: {compiled_parameters.get('source_hash')}"
+                )
+
+                return compiled_parameters
+
+        else:
+            compiled_parameters = None
+
+        contents = await asyncio.gather(
+            *[
+                self._get_parameters_content(parameter_type)
+                for parameter_type in ParameterType
+            ]
+        )
+
+        parameters_content = dict(zip(ParameterType, contents))
+
+        source_hash = self.get_parameters_hash(parameters_content)
+
+        # Sources touched after the artifact, it's kept when the content is the same
+        if (
+            compiled_parameters is not None
+            and compiled_parameters.get("source_hash") == source_hash
+        ):
+            _LOGGER.debug(f"Compiled parameters verified, Source: {source_hash}")
+
+            return compiled_parameters
+
+        _LOGGER.debug(
+            f"Compiled parameters are missing or stale, compiling source: {source_hash}"
+        )
+
+        compiled_parameters = self.compile_parameters(parameters_content)
+
+        return compiled_parameters
+
+    @staticmethod
+    def _is_compiled_parameters_current(
+        compiled_parameters: dict, parameters_stats: dict
     ) -> bool:
-        key = entity_description.key
-        exclude = entity_description.exclude
+        compiled_stat = parameters_stats.get(COMPILED_PARAMETERS_FILE)
+        source_sizes = compiled_parameters.get("source_sizes", [])
+
+        if compiled_stat is None or len(source_sizes) != len(ParameterType):
+            return False
+
+        # Sources of the same size, not modified after the artifact was written
+        for parameter_type, source_size in zip(ParameterType, source_sizes):
+            source_stat = parameters_stats.get(parameter_type)
+
+            if (
+                source_stat is None
+                or source_stat[1] != source_size
+                or source_stat[0] > compiled_stat[0]
+            ):
+                return False
+
+        return True
+
+    async def _get_compiled_parameters_file(self) -> dict | None:
+        file_path = self._get_parameters_path(COMPILED_PARAMETERS_FILE)
+
+        try:
+            file = await aiofiles.open(file_path)
+            content = await file.read()
+            await file.close()
+
+            compiled_parameters = json.loads(content)
 
-        is_valid = (
-            entity_description.platform == platform
-            and entity_description.device_type == device_type
-            and key in data
+        except FileNotFoundError:
+            compiled_parameters = None
+
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.warning(
+                f"Failed to load compiled parameters, Error: {ex}, Line: {line_number}"
+            )
+
+            compiled_parameters = None
+
+        return compiled_parameters
+
+    def _load_compiled_parameters(self, compiled_parameters: dict):
+        self._exclude_uri_list = compiled_parameters.get("exclude_uri_list")
+        self._exclude_type_list = compiled_parameters.get("exclude_type_list")
+        self._data_points = compiled_parameters.get("data_points")
+        self._update_intervals = compiled_parameters.get("update_intervals")
+        self._update_profiles = compiled_parameters.get("update_profiles")
+        self._endpoints = compiled_parameters.get("endpoints")
+        self._endpoint_projections = compiled_parameters.get("endpoint_projections")
+
+        self._extraction_plan = [
+            self._load_data_point_plan(data_point_plan)
+            for data_point_plan in compiled_parameters.get("extraction_plan")
+        ]
+
+        self._load_entity_descriptions(compiled_parameters.get("entity_descriptions"))
+
+    def _load_data_point_plan(self, compiled_data_point_plan: dict) -> dict:
+        property_plans = tuple(
+            (
+                property_key,
+                tuple(path_parts),
+                options,
+                None if option_values is None else frozenset(option_values),
+                validation_warning,
+            )
+            for (
+                property_key,
+                path_parts,
+                options,
+                option_values,
+                validation_warning,
+            ) in compiled_data_point_plan.get("properties")
         )
 
-        if is_valid and exclude:
-            for exclude_key in exclude:
-                exclude_value = exclude[exclude_key]
+        data_point_index = compiled_data_point_plan.get("data_point")
 
-                if isinstance(exclude_value, list):
-                    if data.get(exclude_key) in exclude_value:
-                        is_valid = False
-                        break
+        data_point_plan = {
+            "endpoint": compiled_data_point_plan.get("endpoint"),
+            "path_parts": tuple(compiled_data_point_plan.get("path_parts")),
+            "properties": property_plans,
+            "config": self._data_points[data_point_index],
+        }
 
-                else:
-                    if data.get(exclude_key) == exclude_value:
-                        is_valid = False
-                        break
+        return data_point_plan
 
-        return is_valid
+    @staticmethod
+    def compile_parameters(parameters_content: Mapping[ParameterType, bytes]) -> dict:
+        """Derive the configuration from the parameter files, JSON serializable."""
+        endpoint_validations = json.loads(
+            parameters_content[ParameterType.ENDPOINT_VALIDATIONS]
+        )
+        data_points = json.loads(parameters_content[ParameterType.DATA_POINTS])
 
-    async def _load_data_points_configuration(self):
-        self._update_intervals = {}
-        self._data_points = await self._get_parameters(ParameterType.DATA_POINTS)
+        exclude_uri_list = endpoint_validations.get("exclude_uri")
+        exclude_type_list = endpoint_validations.get("exclude_type")
 
-        endpoint_objects = self._data_points
+        update_intervals = {}
+        update_profiles = {}
 
-        for endpoint in endpoint_objects:
+        for endpoint in data_points:
             endpoint_uri = endpoint.get("endpoint")
             interval = endpoint.get("interval", DEFAULT_INTERVAL)
 
-            if (
-                endpoint_uri not in self._update_intervals
-                and endpoint_uri not in self._exclude_uri_list
-            ):
-                self._update_intervals[endpoint_uri] = self._convert_to_seconds(
+            if endpoint_uri in exclude_uri_list:
+                continue
+
+            if endpoint_uri not in update_intervals:
+                update_intervals[endpoint_uri] = HAConfigManager._convert_to_seconds(
                     interval
                 )
 
-        minimum_update_interval = min(self._update_intervals.values())
-        self._minimum_update_interval = timedelta(seconds=minimum_update_interval)
+            profiles = endpoint.get("profiles", {})
 
-        self._endpoints = list(self._update_intervals.keys())
+            # Printer state to interval, None suspends polling in that state
+            endpoint_profiles = update_profiles.setdefault(endpoint_uri, {})
 
-    async def _load_exclude_endpoints_configuration(self):
-        endpoints = await self._get_parameters(ParameterType.ENDPOINT_VALIDATIONS)
+            for state in profiles:
+                state_interval = (
+                    None
+                    if profiles[state] is None
+                    else HAConfigManager._convert_to_seconds(profiles[state])
+                )
 
-        self._exclude_uri_list = endpoints.get("exclude_uri")
-        self._exclude_type_list = endpoints.get("exclude_type")
+                endpoint_profiles[state] = HAConfigManager._merge_profile_interval(
+                    endpoint_uri,
+                    state,
+                    endpoint_profiles.get(state, state_interval),
+                    state_interval,
+                )
 
-    def get_update_interval(self, endpoint: str) -> int:
-        update_interval = self._update_intervals.get(
-            endpoint, self._default_update_interval
+        extraction_plan = [
+            HAConfigManager._compile_data_point(data_point_index, data_point)
+            for data_point_index, data_point in enumerate(data_points)
+            if data_point.get("endpoint") is not None
+            and data_point.get("properties") is not None
+        ]
+
+        endpoint_projections = {}
+
+        for data_point_plan in extraction_plan:
+            endpoint = data_point_plan.get("endpoint")
+            section_path_parts = data_point_plan.get("path_parts")
+            projection = endpoint_projections.setdefault(endpoint, {})
+
+            for property_plan in data_point_plan.get("properties"):
+                property_path_parts = property_plan[1]
+
+                HAConfigManager._add_projection_path(
+                    projection, section_path_parts + property_path_parts
+                )
+
+        compiled_parameters = {
+            "version": COMPILED_PARAMETERS_VERSION,
+            "source_hash": HAConfigManager.get_parameters_hash(parameters_content),
+            "source_sizes": [
+                len(parameters_content[parameter_type])
+                for parameter_type in ParameterType
+            ],
+            "exclude_uri_list": exclude_uri_list,
+            "exclude_type_list": exclude_type_list,
+            "endpoints": list(update_intervals.keys()),
+            "update_intervals": update_intervals,
+            "update_profiles": update_profiles,
+            "extraction_plan": extraction_plan,
+            "endpoint_projections": endpoint_projections,
+            "entity_descriptions": HAConfigManager._compile_entity_descriptions(
+                data_points
+            ),
+            "data_points": data_points,
+        }
+
+        return compiled_parameters
+
+    @staticmethod
+    def _merge_profile_interval(
+        endpoint: str,
+        state: str,
+        interval: float | None,
+        other_interval: float | None,
+    ) -> float | None:
+        """Data points sharing an endpoint poll it as often as the most demanding one."""
+        if interval == other_interval:
+            return interval
+
+        _LOGGER.warning(
+            f"Conflicting {state} intervals for endpoint {endpoint}, "
+            f"Intervals: {interval}, {other_interval}"
         )
 
+        if interval is None:
+            return other_interval
+
+        if other_interval is None:
+            return interval
+
+        return min(interval, other_interval)
+
+    @staticmethod
+    def _compile_data_point(data_point_index: int, data_point: dict) -> dict:
+        properties = data_point.get("properties")
+
+        property_plans = []
+
+        for property_key in properties:
+            property_details = properties[property_key]
+            options = property_details.get("options")
+
+            # Values are lowercased before being matched against the options
+            property_plan = [
+                property_key,
+                property_details.get("path").split("."),
+                options,
+                None if options is None else [option.lower() for option in options],
+                property_details.get("validationWarning", False),
+            ]
+
+            property_plans.append(property_plan)
+
+        data_point_plan = {
+            "data_point": data_point_index,
+            "endpoint": data_point.get("endpoint"),
+            "path_parts": data_point.get("path").split("."),
+            "properties": property_plans,
+        }
+
+        return data_point_plan
+
+    @staticmethod
+    def _compile_entity_descriptions(data_points: list[dict]) -> list[dict]:
+        entity_descriptions = []
+
+        for data_point in data_points:
+            properties = data_point.get("properties")
+
+            for property_key in properties:
+                property_data = properties[property_key]
+
+                if "platform" not in property_data:
+                    continue
+
+                property_platform = property_data.get("platform")
+
+                entity_description = {
+                    "platform": property_platform,
+                    "key": property_key,
+                    "device_type": data_point.get("device_type"),
+                    "endpoint": data_point.get("endpoint"),
+                    "exclude": property_data.get("exclude"),
+                    "device_class": property_data.get("device_class"),
+                    "icon": property_data.get("icon"),
+                }
+
+                if property_platform == str(Platform.BINARY_SENSOR):
+                    entity_description["on_values"] = [
+                        value.lower() for value in property_data.get("on_values", [])
+                    ]
+
+                elif property_platform == str(Platform.SENSOR):
+                    entity_description["state_class"] = property_data.get("state_class")
+                    entity_description["unit_of_measurement"] = property_data.get(
+                        "unit_of_measurement"
+                    )
+                    entity_description["options"] = property_data.get("options")
+
+                # Unset fields are left out, they load as the description defaults
+                entity_description = {
+                    key: value
+                    for key, value in entity_description.items()
+                    if value is not None
+                }
+
+                entity_descriptions.append(entity_description)
+
+        return entity_descriptions
+
+    @staticmethod
+    def _add_projection_path(projection: dict, path_parts: tuple[str, ...]):
+        """Add the elements of a path to the projection, None keeps the whole subtree."""
+        element_names = []
+
+        for path_part in path_parts:
+            # Attributes and text belong to the element that holds them
+            if path_part.startswith(("@", "#")):
+                break
+
+            # List indices select an item of the repeated element, not an element
+            if path_part.isdigit():
+                continue
+
+            element_names.append(path_part)
+
+        node = projection
+
+        for element_name in element_names[:-1]:
+            if element_name in node and node[element_name] is None:
+                return
+
+            node = node.setdefault(element_name, {})
+
+        node[element_names[-1]] = None
+
+    def get_endpoint_projection(self, endpoint: str) -> dict | None:
+        projection = self._endpoint_projections.get(endpoint)
+
+        return projection
+
+    def get_update_interval(
+        self, endpoint: str, printer_state: str | None = None
+    ) -> float | None:
+        profiles = self._update_profiles.get(endpoint, {})
+
+        if printer_state in profiles:
+            update_interval = profiles[printer_state]
+
+        else:
+            update_interval = self._update_intervals.get(
+                endpoint, self._default_update_interval
+            )
+
         return update_interval
 
     @staticmethod
-    async def _get_parameters(parameter_type: ParameterType) -> dict:
+    def _get_parameters_path(parameter_type: ParameterType | str) -> str:
         config_file = f"{parameter_type}.json"
         current_path = Path(__file__)
         parent_directory = current_path.parents[1]
         file_path = os.path.join(parent_directory, "parameters", config_file)
 
-        file = await aiofiles.open(file_path)
+        return file_path
+
+    @staticmethod
+    async def _get_parameters_stat(
+        parameter_type: ParameterType | str,
+    ) -> tuple[int, int] | None:
+        file_path = HAConfigManager._get_parameters_path(parameter_type)
+
+        try:
+            file_stat = await aiofiles.os.stat(file_path)
+
+        except FileNotFoundError:
+            return None
+
+        return file_stat.st_mtime_ns, file_stat.st_size
+
+    @staticmethod
+    async def _get_parameters_content(parameter_type: ParameterType) -> bytes:
+        file_path = HAConfigManager._get_parameters_path(parameter_type)
+
+        file = await aiofiles.open(file_path, "rb")
         content = await file.read()
         await file.close()
 
-        data = json.loads(content)
+        return content
 
-        return data
+    @staticmethod
+    def get_parameters_hash(parameters_content: Mapping[ParameterType, bytes]) -> str:
+        parameters_hash = hashlib.sha256()
+
+        for parameter_type in ParameterType:
+            parameters_hash.update(parameters_content[parameter_type])
+
+        return parameters_hash.hexdigest()
 
     @staticmethod
-    def _convert_to_seconds(duration: str | None) -> int:
+    def _convert_to_seconds(duration: str | float | None) -> float:
         if duration is None:
             duration = DEFAULT_INTERVAL
 
-        count = int(duration[:-1])
-        unit = DURATION_UNITS[duration[-1]]
+        if isinstance(duration, (int, float)):
+            return float(duration)
+
+        # Units are matched in order, milliseconds before minutes and seconds
+        unit_key = [key for key in DURATION_UNITS if duration.endswith(key)][0]
+
+        count = float(duration[: -len(unit_key)])
+        unit = DURATION_UNITS[unit_key]
         td = timedelta(**{unit: count})
-        seconds = td.seconds + 60 * 60 * 24 * td.days
+        seconds = td.total_seconds()
 
         return seconds
 
@@ -1,12 +1,16 @@
+import asyncio
+from collections.abc import Callable
 import logging
 import sys
+from typing import Any
 
-from homeassistant.core import Event, callback
+from homeassistant.core import CALLBACK_TYPE, Event, callback
 from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
 )
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import slugify
 
@@ -14,9 +18,11 @@ from ..common.consts import (
     DOMAIN,
     MODEL_PROPERTY,
     PRINTER_MAIN_DEVICE,
-    SIGNAL_HA_DEVICE_CREATED,
-    SIGNAL_HA_DEVICE_DISCOVERED,
+    SIGNAL_HA_DEVICES_CREATED,
+    SIGNAL_HA_DEVICES_DISCOVERED,
 )
+from ..common.entity_descriptions import IntegrationEntityDescription
+from .fleet_manager import FleetManager
 from .ha_config_manager import HAConfigManager
 from .rest_api import RestAPIv2
 
@@ -30,19 +36,32 @@ class HACoordinator(DataUpdateCoordinator):
         self,
         hass,
         config_manager: HAConfigManager,
+        fleet_manager: FleetManager | None = None,
     ):
         """Initialize my coordinator."""
         super().__init__(
             hass,
             _LOGGER,
             name=config_manager.entry_title,
-            update_interval=config_manager.minimum_update_interval,
+            # Refreshes are scheduled by the next endpoint deadline
+            update_interval=None,
             update_method=self._async_update_data,
         )
 
         self._api = RestAPIv2(hass, config_manager)
         self._config_manager = config_manager
+        self._fleet_manager = fleet_manager
         self._devices: dict[str, DeviceInfo] = {}
+        self._entity_endpoints: dict[str, int] = {}
+        self._context_listeners: dict[Any, list[CALLBACK_TYPE]] = {}
+        self._notified_update_success: bool | None = None
+        self._notified_stale: bool | None = None
+        self._unsub_status_update: CALLBACK_TYPE | None = None
+        self._unsub_endpoints_update: CALLBACK_TYPE | None = None
+        # Refresh and endpoints lane must not request and merge endpoints concurrently
+        self._endpoints_lock = asyncio.Lock()
+        self._is_terminated = False
+        self._event_listener: asyncio.Task | None = None
 
         self._main_device_data: dict | None = None
         self._main_device_id: str | None = None
@@ -55,6 +74,12 @@ class HACoordinator(DataUpdateCoordinator):
 
         self._load_signal_handlers()
 
+        # Fleet entries share the timer and the requests budget
+        if fleet_manager is not None:
+            fleet_manager.register(self.entry_id, self._api)
+
+            self._api.set_request_slot(fleet_manager.request_slot)
+
     @property
     def api(self) -> RestAPIv2:
         return self._api
@@ -71,19 +96,52 @@ class HACoordinator(DataUpdateCoordinator):
     def entry_title(self) -> str:
         return self._config_manager.entry_title
 
+    @property
+    def is_stale(self) -> bool:
+        return self._api.is_stale
+
     async def on_home_assistant_start(self, _event_data: Event):
         await self.initialize()
 
     async def on_home_assistant_stop(self, _event_data: Event):
+        await self.terminate()
+
+    async def terminate(self):
+        # Lanes in flight must not schedule themselves again once they complete
+        self._is_terminated = True
+
+        self._cancel_status_update()
+        self._cancel_endpoints_update()
+        self._cancel_event_listener()
+
+        if self._fleet_manager is not None:
+            self._fleet_manager.unregister(self.entry_id)
+
         await self._api.terminate()
 
-    async def initialize(self):
-        _LOGGER.debug("Initializing coordinator")
+        await self._config_manager.flush_snapshot()
 
+    async def warm_start(self):
+        """Set up the platforms with the devices of the last session, before polling."""
         entry = self.config_manager.entry
         platforms = self.config_manager.platforms
         await self.hass.config_entries.async_forward_entry_setups(entry, platforms)
 
+        snapshot = await self._config_manager.get_snapshot()
+
+        if snapshot is None:
+            return
+
+        devices = self._api.restore_snapshot(snapshot)
+
+        if devices:
+            self._create_devices(devices)
+
+    async def initialize(self):
+        _LOGGER.debug("Initializing coordinator")
+
+        entry = self.config_manager.entry
+
         _LOGGER.info(f"Start loading {DOMAIN} integration, Entry ID: {entry.entry_id}")
 
         await self._api.initialize()
@@ -94,18 +152,12 @@ class HACoordinator(DataUpdateCoordinator):
         loop = self.hass.loop
 
         @callback
-        def on_device_discovered(
-            entry_id: str, device_key: str, device_data: dict, device_config: dict
-        ):
-            loop.create_task(
-                self._on_device_discovered(
-                    entry_id, device_key, device_data, device_config
-                )
-            ).__await__()
+        def on_devices_discovered(entry_id: str, devices: dict[str, dict]):
+            loop.create_task(self._on_devices_discovered(entry_id, devices)).__await__()
 
         self.config_entry.async_on_unload(
             async_dispatcher_connect(
-                self.hass, SIGNAL_HA_DEVICE_DISCOVERED, self._on_device_discovered
+                self.hass, SIGNAL_HA_DEVICES_DISCOVERED, self._on_devices_discovered
             )
         )
 
@@ -283,6 +335,84 @@ class HACoordinator(DataUpdateCoordinator):
                 f"Line: {line_number}"
             )
 
+    def register_entity(self, entity_description: IntegrationEntityDescription):
+        endpoint = self._config_manager.get_entity_endpoint(entity_description)
+
+        if endpoint is not None:
+            entities = self._entity_endpoints.get(endpoint, 0)
+
+            self._entity_endpoints[endpoint] = entities + 1
+
+            self._api.set_entity_endpoints(self._entity_endpoints)
+
+    def unregister_entity(self, entity_description: IntegrationEntityDescription):
+        endpoint = self._config_manager.get_entity_endpoint(entity_description)
+
+        if endpoint in self._entity_endpoints:
+            entities = self._entity_endpoints.get(endpoint)
+
+            self._entity_endpoints[endpoint] = entities - 1
+
+            self._api.set_entity_endpoints(self._entity_endpoints)
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> CALLBACK_TYPE:
+        remove_listener = super().async_add_listener(update_callback, context)
+
+        listeners = self._context_listeners.setdefault(context, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_context_listener() -> None:
+            listeners.remove(update_callback)
+
+            if not listeners:
+                self._context_listeners.pop(context, None)
+
+            remove_listener()
+
+        return remove_context_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        last_update_success = self.last_update_success
+        is_stale = self._api.is_stale
+
+        if (
+            last_update_success != self._notified_update_success
+            or is_stale != self._notified_stale
+        ):
+            self._notified_update_success = last_update_success
+            self._notified_stale = is_stale
+
+            self._api.clear_data_changes()
+
+            # Availability or staleness of all entities changes
+            super().async_update_listeners()
+
+            return
+
+        data_changes = self._api.data_changes
+
+        update_callbacks = list(self._context_listeners.get(None, []))
+
+        for device_key in data_changes:
+            for key in data_changes[device_key]:
+                listeners = self._context_listeners.get((device_key, key), [])
+
+                update_callbacks.extend(listeners)
+
+        _LOGGER.debug(
+            f"Notifying {len(update_callbacks)} listeners, Changes: {data_changes}"
+        )
+
+        self._api.clear_data_changes()
+
+        for update_callback in update_callbacks:
+            update_callback()
+
     def get_device(self, device_key: str) -> DeviceInfo | None:
         result = self._devices.get(device_key)
 
@@ -301,13 +431,24 @@ class HACoordinator(DataUpdateCoordinator):
 
         return data
 
-    def get_debug_data(self) -> dict:
+    async def get_debug_data(self) -> dict:
+        raw_data, projected_endpoints = await self._api.get_raw_documents()
+
         data = {
-            "rawData": self._api.raw_data,
+            "rawData": raw_data,
+            "rawDataProjected": projected_endpoints,
             "devicesData": self._api.data,
             "devicesConfig": self._api.data_config,
+            "endpointStatistics": self._api.endpoint_statistics,
+            "endpointTimeouts": self._api.endpoint_timeouts,
+            "connectionStatistics": self._api.connection_statistics,
+            "laneStatistics": self._api.lane_statistics,
+            "stale": self._api.is_stale,
         }
 
+        if self._fleet_manager is not None:
+            data["fleet"] = self._fleet_manager.get_debug_data()
+
         return data
 
     def get_devices(self) -> dict[str, DeviceInfo]:
@@ -315,19 +456,179 @@ class HACoordinator(DataUpdateCoordinator):
 
     async def _async_update_data(self):
         try:
-            await self._api.update()
+            async with self._endpoints_lock:
+                await self._api.update()
 
             return self._api.data
 
         except Exception as err:
             raise UpdateFailed(f"Error communicating with API: {err}")
 
-    async def _on_device_discovered(
-        self, entry_id: str, device_key: str, device_data: dict, device_config: dict
-    ):
-        if entry_id != self.config_entry.entry_id:
+        finally:
+            self._schedule_status_update()
+            self._schedule_endpoints_update()
+            self._start_event_listener()
+
+    async def _async_update_status(self):
+        """Status lane, decides availability and is never queued behind endpoints."""
+        try:
+            await self._api.update_status()
+
+            self.async_set_updated_data(self._api.data)
+
+        except Exception as err:
+            self.async_set_update_error(
+                UpdateFailed(f"Error communicating with API: {err}")
+            )
+
+        finally:
+            self._schedule_status_update()
+
+            # Catching up after the printer came back online
+            if not self._endpoints_lock.locked():
+                self._schedule_endpoints_update()
+
+            self._start_event_listener()
+
+    async def _async_update_endpoints(self):
+        try:
+            async with self._endpoints_lock:
+                await self._api.update_endpoints()
+
+            # Endpoint failures do not change availability, only the status lane does
+            self.data = self._api.data
+            self.async_update_listeners()
+
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.error(
+                f"Failed to update endpoints, Error: {ex}, Line: {line_number}"
+            )
+
+        finally:
+            self._schedule_endpoints_update()
+
+    async def _async_listen_events(self):
+        """Event lane, holds one long-poll of the event table while push is enabled."""
+        try:
+            while self._config_manager.push:
+                endpoints = await self._api.wait_for_events()
+
+                if endpoints is None:
+                    break
+
+                if endpoints:
+                    self._schedule_status_update()
+
+                    if not self._endpoints_lock.locked():
+                        self._schedule_endpoints_update()
+
+        except asyncio.CancelledError:
+            raise
+
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.error(f"Failed to listen events, Error: {ex}, Line: {line_number}")
+
+        self._event_listener = None
+
+        # Push stopped, availability and intervals are back with the polling lanes
+        self._schedule_status_update()
+
+        if not self._endpoints_lock.locked():
+            self._schedule_endpoints_update()
+
+    def _start_event_listener(self):
+        if (
+            self._is_terminated
+            or self._event_listener is not None
+            or not self._api.is_push_available
+        ):
+            return
+
+        _LOGGER.debug(f"Listening to events of {self.entry_title}")
+
+        self._event_listener = self.hass.async_create_background_task(
+            self._async_listen_events(), f"{DOMAIN} {self.entry_title} events"
+        )
+
+    def _cancel_event_listener(self):
+        if self._event_listener is not None:
+            self._event_listener.cancel()
+
+            self._event_listener = None
+
+    def _schedule_status_update(self):
+        self._cancel_status_update()
+
+        if self._is_terminated:
+            return
+
+        delay = self._api.get_next_status_delay()
+
+        self._unsub_status_update = self._call_later(delay, self._on_status_update)
+
+    def _schedule_endpoints_update(self):
+        self._cancel_endpoints_update()
+
+        if self._is_terminated:
+            return
+
+        delay = self._api.get_next_endpoints_delay()
+
+        if delay is None:
+            return
+
+        _LOGGER.debug(f"Next endpoints update of {self.entry_title} in {delay:.3f}s")
+
+        self._unsub_endpoints_update = self._call_later(
+            delay, self._on_endpoints_update
+        )
+
+    def _call_later(self, delay: float, action: Callable) -> CALLBACK_TYPE:
+        if self._fleet_manager is None:
+            unsub = async_call_later(self.hass, delay, action)
+
+        else:
+            unsub = self._fleet_manager.async_call_later(delay, action)
+
+        return unsub
+
+    def _cancel_status_update(self):
+        if self._unsub_status_update is not None:
+            self._unsub_status_update()
+
+            self._unsub_status_update = None
+
+    def _cancel_endpoints_update(self):
+        if self._unsub_endpoints_update is not None:
+            self._unsub_endpoints_update()
+
+            self._unsub_endpoints_update = None
+
+    @callback
+    def _on_status_update(self, _now):
+        self._unsub_status_update = None
+
+        if self._is_terminated:
             return
 
+        self.hass.async_create_task(self._async_update_status())
+
+    @callback
+    def _on_endpoints_update(self, _now):
+        self._unsub_endpoints_update = None
+
+        if self._is_terminated:
+            return
+
+        self.hass.async_create_task(self._async_update_endpoints())
+
+    def _create_device(self, device_key: str, device_data: dict, device_config: dict):
         handlers = [
             device_prefix
             for device_prefix in self._device_handlers
@@ -343,13 +644,33 @@ class HACoordinator(DataUpdateCoordinator):
         else:
             self.create_sub_unit_device(device_key, device_data, device_config)
 
+    async def _on_devices_discovered(self, entry_id: str, devices: dict[str, dict]):
+        if entry_id != self.config_entry.entry_id:
+            return
+
+        self._create_devices(devices)
+
+        # One refresh per discovered batch
+        self.hass.create_task(self.async_request_refresh())
+
+    def _create_devices(self, devices: dict[str, dict]):
+        # Sub unit devices are linked to the main device, it's created first
+        device_keys = sorted(
+            devices, key=lambda device_key: device_key != PRINTER_MAIN_DEVICE
+        )
+
+        for device_key in device_keys:
+            device = devices[device_key]
+
+            self._create_device(device_key, device.get("data"), device.get("config"))
+
+        _LOGGER.debug(
+            f"Devices of {self.entry_title} created, Keys: {', '.join(device_keys)}"
+        )
+
         async_dispatcher_send(
             self.hass,
-            SIGNAL_HA_DEVICE_CREATED,
+            SIGNAL_HA_DEVICES_CREATED,
             self.entry_id,
-            device_key,
-            device_data,
-            device_config,
+            devices,
         )
-
-        self.hass.create_task(self.async_request_refresh())
@@ -1,15 +1,24 @@
+import asyncio
+from collections import deque
+from collections.abc import Callable
 from datetime import datetime
+import hashlib
+import heapq
 import json
 import logging
+import math
+import random
 import sys
-
-from aiohttp import ClientResponseError, ClientSession, ClientTimeout, TCPConnector
-from defusedxml import ElementTree
-from flatten_json import flatten
-import xmltodict
-
-from homeassistant.helpers.aiohttp_client import (
-    async_create_clientsession,
+import time
+
+from aiohttp import (
+    ClientResponse,
+    ClientResponseError,
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+    TraceConfig,
+    hdrs,
 )
 
 from homeassistant.helpers.dispatcher import dispatcher_send
@@ -17,11 +26,34 @@ from homeassistant.util import slugify, ssl
 from homeassistant.util.ssl import SSLCipherList
 
 from ..common.consts import (
+    CATCH_UP_WINDOW,
+    CONNECTION_DNS_CACHE_TTL,
+    CONNECTION_KEEPALIVE_TIMEOUT,
+    EVENT_TABLE_ENDPOINT,
+    EVENT_TABLE_LONG_POLL_TIMEOUT,
+    EVENT_TABLE_MAX_QUICK_REPLIES,
+    EVENT_TABLE_MIN_INTERVAL,
+    EVENT_TABLE_SAFETY_INTERVAL,
     IGNORED_KEYS,
+    JSON_CONTENT_TYPE,
+    OFFLINE_PROBE_CONNECT_TIMEOUT,
+    OFFLINE_PROBE_MAX_INTERVAL,
+    PRINTER_MAIN_DEVICE,
+    PRINTER_STATE_PROPERTY,
+    PRODUCT_MAIN_ENDPOINT,
     PRODUCT_STATUS_ENDPOINT,
     PRODUCT_STATUS_OFFLINE_PAYLOAD,
-    SIGNAL_HA_DEVICE_DISCOVERED,
+    REQUEST_LATENCY_MIN_SAMPLES,
+    REQUEST_LATENCY_SAMPLES,
+    REQUEST_TIMEOUT,
+    REQUEST_TIMEOUT_FACTOR,
+    REQUEST_TIMEOUT_MAX,
+    REQUEST_TIMEOUT_MIN,
+    REQUEST_TIMEOUT_PERCENTILE,
+    SIGNAL_HA_DEVICES_DISCOVERED,
+    STREAM_CHUNK_SIZE,
 )
+from ..common.xml_converter import XmlDictConverter
 from ..models.config_data import ConfigData
 from .ha_config_manager import HAConfigManager
 
@@ -36,17 +68,39 @@ class RestAPIv2:
         self._endpoints = self._config_manager.endpoints
 
         self._session: ClientSession | None = None
+        self._request_slot: Callable | None = None
 
         self._data: dict = {}
         self._data_config: dict = {}
-        self._last_update: dict[str, float] = {}
+        self._data_changes: dict[str, set[str]] = {}
+        self._deadlines: dict[str, float] = {}
+        self._deadline_heap: list[tuple[float, str]] = []
+        self._fetched_endpoints: set[str] = set()
+        self._entity_endpoints: dict[str, int] = {}
 
         self._raw_data: dict = {}
-
-        self._device_dispatched: list[str] = []
+        self._endpoint_cache: dict[str, dict] = {}
+        self._full_documents: bool = False
+        self._endpoint_versions: dict[str, int] = {}
+        self._extraction_cache: dict[int, dict] = {}
+        self._endpoint_statistics: dict[str, dict[str, int]] = {}
+        self._endpoint_latencies: dict[str, deque[float]] = {}
+        self._connection_statistics: dict[str, int] = {"created": 0, "reused": 0}
+        self._lane_statistics: dict[str, dict] = {}
+
+        self._device_dispatched: set[str] = set()
+        self._snapshot: dict | None = None
         self._support_prefetch: bool = False
 
         self._is_online: bool = False
+        self._offline_probes: int = 0
+        self._printer_state: str | None = None
+
+        self._is_push_active: bool = False
+        self._event_table_etag: str | None = None
+        self._event_stamps: dict[str, tuple] = {}
+        self._event_endpoints: set[str] = set()
+        self._event_quick_replies: int = 0
 
     @property
     def data(self) -> dict | None:
@@ -56,10 +110,69 @@ class RestAPIv2:
     def data_config(self) -> dict | None:
         return self._data_config
 
+    @property
+    def data_changes(self) -> dict[str, set[str]]:
+        return self._data_changes
+
     @property
     def raw_data(self) -> dict | None:
         return self._raw_data
 
+    @property
+    def endpoint_statistics(self) -> dict:
+        statistics = {}
+
+        for endpoint in self._endpoint_statistics:
+            endpoint_statistics = self._endpoint_statistics[endpoint]
+
+            requests = sum(endpoint_statistics.values())
+            hits = endpoint_statistics.get("not_modified", 0) + endpoint_statistics.get(
+                "unchanged", 0
+            )
+
+            statistics[endpoint] = {
+                **endpoint_statistics,
+                "hit_ratio": round(hits / requests, 3),
+            }
+
+        return statistics
+
+    @property
+    def endpoint_timeouts(self) -> dict:
+        timeouts = {
+            endpoint: {
+                "samples": len(self._endpoint_latencies[endpoint]),
+                "latency_percentile": self._get_latency_percentile(endpoint),
+                "timeout": self._get_timeout(endpoint),
+            }
+            for endpoint in self._endpoint_latencies
+        }
+
+        return timeouts
+
+    @property
+    def connection_statistics(self) -> dict:
+        created = self._connection_statistics.get("created")
+        reused = self._connection_statistics.get("reused")
+
+        connections = created + reused
+        reuse_ratio = 0 if connections == 0 else round(reused / connections, 3)
+
+        statistics = {
+            "created": created,
+            "reused": reused,
+            "reuse_ratio": reuse_ratio,
+        }
+
+        return statistics
+
+    def clear_data_changes(self):
+        self._data_changes = {}
+
+    @property
+    def lane_statistics(self) -> dict:
+        return self._lane_statistics
+
     @property
     def config_data(self) -> ConfigData | None:
         if self._config_manager is not None:
@@ -71,6 +184,24 @@ class RestAPIv2:
     def is_online(self) -> bool:
         return self._is_online
 
+    @property
+    def is_stale(self) -> bool:
+        return self._snapshot is not None
+
+    @property
+    def is_push_available(self) -> bool:
+        now_ts = datetime.now().timestamp()
+
+        is_available = (
+            self._config_manager.push
+            and self._is_online
+            and not self._config_manager.is_endpoint_unsupported(
+                EVENT_TABLE_ENDPOINT, now_ts
+            )
+        )
+
+        return is_available
+
     async def terminate(self):
         _LOGGER.info("Terminating session to HP Printer EWS")
 
@@ -82,10 +213,10 @@ class RestAPIv2:
     async def initialize(self):
         try:
             if self._session is None:
-                if self._hass is None:
-                    self._session = ClientSession(loop=self._loop)
-                else:
-                    self._session = async_create_clientsession(hass=self._hass)
+                self._session = ClientSession(
+                    connector=self._get_ssl_connector(),
+                    trace_configs=[self._get_trace_config()],
+                )
 
             await self._update_product_status_endpoint_data()
 
@@ -101,42 +232,333 @@ class RestAPIv2:
         ssl_context = ssl.create_no_verify_ssl_context(SSLCipherList.INTERMEDIATE)
 
         connector = TCPConnector(
-            loop=self._loop,
-            enable_cleanup_closed=True, # Hardcoded op True aangezien de constante weg is
+            enable_cleanup_closed=True,  # Hardcoded op True aangezien de constante weg is
             ssl=ssl_context,
+            # Connections beyond the endpoints concurrency kept for the status and events
+            limit_per_host=self._config_manager.concurrency + 2,
+            keepalive_timeout=CONNECTION_KEEPALIVE_TIMEOUT.total_seconds(),
+            use_dns_cache=True,
+            ttl_dns_cache=int(CONNECTION_DNS_CACHE_TTL.total_seconds()),
         )
 
         return connector
 
-    async def _update_endpoint_data(self, endpoint: str) -> bool:
-        can_update = False
+    def _get_trace_config(self) -> TraceConfig:
+        trace_config = TraceConfig()
 
-        try:
-            now = datetime.now()
-            now_ts = now.timestamp()
+        trace_config.on_connection_create_end.append(self._on_connection_created)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reused)
+
+        return trace_config
+
+    async def _on_connection_created(self, _session, _context, _params):
+        self._connection_statistics["created"] += 1
 
-            last_update = self._last_update.get(endpoint, 0)
+    async def _on_connection_reused(self, _session, _context, _params):
+        self._connection_statistics["reused"] += 1
 
-            last_update_diff = int(now_ts - last_update)
+    def set_request_slot(self, request_slot: Callable | None):
+        self._request_slot = request_slot
+
+    def set_entity_endpoints(self, entity_endpoints: dict[str, int]):
+        self._entity_endpoints = dict(entity_endpoints)
+
+    def _set_deadline(self, endpoint: str, deadline: float):
+        self._deadlines[endpoint] = deadline
+
+        # Status has its own lane, replaced deadlines are skipped once they surface
+        if endpoint != PRODUCT_STATUS_ENDPOINT:
+            heapq.heappush(self._deadline_heap, (deadline, endpoint))
+
+    def _get_update_interval(self, endpoint: str) -> float | None:
+        interval = self._config_manager.get_update_interval(
+            endpoint, self._printer_state
+        )
+
+        # Suspension needs data to keep, first fetch and catch-up run regardless
+        if interval is None and endpoint not in self._fetched_endpoints:
             interval = self._config_manager.get_update_interval(endpoint)
 
-            can_update = last_update_diff >= interval
+        is_pushed = (
+            self._is_push_active
+            and endpoint in self._event_endpoints
+            and endpoint != PRODUCT_STATUS_ENDPOINT
+        )
 
-            if can_update:
-                data = await self._get_request(endpoint)
+        # Changes are pushed by the event table, polling is only a safety net
+        if interval is not None and is_pushed:
+            interval = max(interval, EVENT_TABLE_SAFETY_INTERVAL.total_seconds())
 
-                self._raw_data[endpoint] = data
-                self._last_update[endpoint] = now_ts
+        return interval
 
-        except Exception as ex:
-            exc_type, exc_obj, tb = sys.exc_info()
-            line_number = tb.tb_lineno
+    def _set_next_deadline(self, endpoint: str, now: float):
+        interval = self._get_update_interval(endpoint)
 
-            _LOGGER.error(
-                f"Failed to update endpoint {endpoint} data, Error: {ex}, Line: {line_number}"
+        if interval is None:
+            # Suspended by the polling profile of the printer state
+            self._deadlines[endpoint] = math.inf
+
+            return
+
+        # Following the previous deadline keeps the cadence free of drift
+        deadline = self._deadlines.get(endpoint, now) + interval
+
+        if deadline <= now:
+            deadline = now + interval
+
+        self._set_deadline(endpoint, deadline)
+
+    def _is_deadline_current(self, deadline: float, endpoint: str) -> bool:
+        is_current = self._deadlines.get(endpoint) == deadline
+
+        return is_current
+
+    def _pop_due_endpoints(self, now: float) -> list[str]:
+        due_endpoints = []
+
+        while self._deadline_heap and self._deadline_heap[0][0] <= now:
+            deadline, endpoint = heapq.heappop(self._deadline_heap)
+
+            is_current = self._is_deadline_current(deadline, endpoint)
+
+            if is_current and endpoint not in due_endpoints:
+                due_endpoints.append(endpoint)
+
+        return due_endpoints
+
+    def get_next_status_delay(self) -> float:
+        """Seconds until the status endpoint is due, on the monotonic clock."""
+        next_deadline = self._deadlines.get(PRODUCT_STATUS_ENDPOINT)
+
+        if next_deadline is None:
+            delay = 0
+
+        else:
+            delay = max(next_deadline - time.monotonic(), 0)
+
+        return delay
+
+    def get_next_endpoints_delay(self) -> float | None:
+        """Seconds until the next endpoint is due, None while the printer is offline."""
+        if not self._is_online:
+            return None
+
+        while self._deadline_heap and not self._is_deadline_current(
+            *self._deadline_heap[0]
+        ):
+            heapq.heappop(self._deadline_heap)
+
+        if self._deadline_heap:
+            delay = max(self._deadline_heap[0][0] - time.monotonic(), 0)
+
+        elif any(endpoint != PRODUCT_STATUS_ENDPOINT for endpoint in self._deadlines):
+            # All endpoints are suspended by the polling profile
+            delay = None
+
+        else:
+            delay = 0
+
+        return delay
+
+    def _update_printer_state(self):
+        main_device_data = self._data.get(PRINTER_MAIN_DEVICE, {})
+        printer_state = main_device_data.get(PRINTER_STATE_PROPERTY)
+
+        if printer_state is not None:
+            printer_state = str(printer_state).lower()
+
+        if printer_state == self._printer_state:
+            return
+
+        _LOGGER.debug(
+            f"Printer {self.config_data.hostname} state changed, "
+            f"From: {self._printer_state}, "
+            f"To: {printer_state}"
+        )
+
+        self._printer_state = printer_state
+
+        self._apply_polling_profile(time.monotonic())
+
+    def _apply_polling_profile(self, now: float):
+        for endpoint in self._deadlines:
+            if endpoint == PRODUCT_STATUS_ENDPOINT:
+                continue
+
+            interval = self._get_update_interval(endpoint)
+
+            deadline = self._deadlines[endpoint]
+
+            if interval is None:
+                self._deadlines[endpoint] = math.inf
+
+            elif now + interval < deadline:
+                # Tighter or resumed polling, looser intervals apply after the next fetch
+                self._set_deadline(endpoint, now + interval)
+
+    def _schedule_catch_up(self, now: float):
+        endpoints = [
+            endpoint
+            for endpoint in self._config_manager.endpoints
+            if endpoint != PRODUCT_STATUS_ENDPOINT
+        ]
+
+        # Main device details first, then by the number of enabled entities they back
+        endpoints.sort(
+            key=lambda endpoint: (
+                endpoint != PRODUCT_MAIN_ENDPOINT,
+                -self._entity_endpoints.get(endpoint, 0),
             )
+        )
+
+        slot = CATCH_UP_WINDOW.total_seconds() / max(len(endpoints), 1)
+
+        for index, endpoint in enumerate(endpoints):
+            self._set_deadline(endpoint, now + index * slot)
+
+        self._fetched_endpoints.clear()
+
+        # Polling profile applies again once the new status is extracted
+        self._printer_state = None
+
+        _LOGGER.debug(
+            f"Catching up {self.config_data.hostname} within {CATCH_UP_WINDOW}, "
+            f"Order: {', '.join(endpoints)}"
+        )
+
+    def _set_endpoint_data(self, endpoint: str, data: dict | None) -> bool:
+        # Unchanged payloads are served from the endpoint cache as the same object
+        was_changed = (
+            endpoint not in self._raw_data or self._raw_data[endpoint] is not data
+        )
+
+        self._raw_data[endpoint] = data
+
+        if was_changed:
+            version = self._endpoint_versions.get(endpoint, 0)
+
+            self._endpoint_versions[endpoint] = version + 1
+
+        return was_changed
+
+    async def _update_endpoints_data(self, endpoints: list[str]) -> int:
+        update_counter = 0
+
+        now = time.monotonic()
+        now_ts = datetime.now().timestamp()
+
+        # Status endpoint is probed on its own schedule
+        endpoints = [
+            endpoint for endpoint in endpoints if endpoint != PRODUCT_STATUS_ENDPOINT
+        ]
+
+        for endpoint in endpoints:
+            if endpoint not in self._deadlines:
+                self._set_deadline(endpoint, now)
+
+        due_endpoints = []
+
+        for endpoint in self._pop_due_endpoints(now):
+            if endpoint not in endpoints:
+                self._set_deadline(endpoint, now)
+
+            elif self._config_manager.is_endpoint_unsupported(endpoint, now_ts):
+                self._set_next_deadline(endpoint, now)
+
+            else:
+                due_endpoints.append(endpoint)
+
+        if not due_endpoints:
+            return update_counter
 
-        return can_update
+        semaphore = asyncio.Semaphore(self._config_manager.concurrency)
+
+        async def _get_limited_request(endpoint: str) -> dict | None:
+            async with semaphore:
+                return await self._get_slotted_request(endpoint)
+
+        results = await asyncio.gather(
+            *[_get_limited_request(endpoint) for endpoint in due_endpoints],
+            return_exceptions=True,
+        )
+
+        failures = len(
+            [
+                result
+                for result in results
+                if result is None or isinstance(result, Exception)
+            ]
+        )
+
+        self._update_lane_statistics("endpoints", time.monotonic() - now, failures)
+
+        # Results are merged in the endpoints order, regardless of completion order
+        for endpoint, result in zip(due_endpoints, results):
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    f"Failed to update endpoint {endpoint} data, Error: {result}"
+                )
+
+                retry_interval = self._config_manager.get_update_interval(
+                    PRODUCT_STATUS_ENDPOINT
+                )
+
+                self._set_deadline(endpoint, now + retry_interval)
+
+                continue
+
+            if result is not None:
+                self._fetched_endpoints.add(endpoint)
+
+            self._set_next_deadline(endpoint, now)
+
+            if self._set_endpoint_data(endpoint, result):
+                update_counter += 1
+
+        return update_counter
+
+    def _get_offline_probe_delay(self) -> float:
+        interval = self._config_manager.get_update_interval(PRODUCT_STATUS_ENDPOINT)
+
+        delay = min(
+            interval * 2 ** (self._offline_probes - 1),
+            OFFLINE_PROBE_MAX_INTERVAL.total_seconds(),
+        )
+
+        # Jitter spreads probes of printers that went offline together,
+        # never sooner than the backoff delay itself
+        jittered_delay = random.uniform(delay, delay * 1.5)
+
+        _LOGGER.debug(
+            f"Printer {self.config_data.hostname} is offline, "
+            f"Probes: {self._offline_probes}, "
+            f"Next probe in: {jittered_delay:.3f}s"
+        )
+
+        return jittered_delay
+
+    async def _is_port_open(self) -> bool:
+        try:
+            _reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    self.config_data.hostname, self.config_data.port
+                ),
+                timeout=OFFLINE_PROBE_CONNECT_TIMEOUT.total_seconds(),
+            )
+
+            writer.close()
+            await writer.wait_closed()
+
+            is_open = True
+
+        except (OSError, TimeoutError) as ex:
+            _LOGGER.debug(
+                f"Printer {self.config_data.hostname} is not reachable, Error: {ex}"
+            )
+
+            is_open = False
+
+        return is_open
 
     async def _update_product_status_endpoint_data(self) -> bool:
         was_changed = False
@@ -144,27 +566,45 @@ class RestAPIv2:
         try:
             status_endpoint = PRODUCT_STATUS_ENDPOINT
 
-            was_online = self.is_online
-            was_updated = await self._update_endpoint_data(status_endpoint)
+            now = time.monotonic()
 
-            if was_updated:
-                product_status_data = self._raw_data.get(status_endpoint)
-                self._is_online = product_status_data is not None
+            if now >= self._deadlines.get(status_endpoint, 0):
+                was_online = self.is_online
 
-                if not self._is_online:
-                    self._raw_data[status_endpoint] = PRODUCT_STATUS_OFFLINE_PAYLOAD
+                # Set before probing, a failing probe must not be due again right away
+                self._set_next_deadline(status_endpoint, now)
 
-                was_changed = self._is_online != was_online
+                if self._offline_probes > 0 and not await self._is_port_open():
+                    data = None
 
-            if was_changed:
-                _LOGGER.debug(f"Device online state changed to {self._is_online}")
+                else:
+                    data = await self._get_slotted_request(status_endpoint)
 
-                got_online = not was_online and self._is_online
+                self._is_online = data is not None
 
-                if got_online:
-                    for endpoint in self._last_update:
-                        if endpoint != PRODUCT_STATUS_ENDPOINT:
-                            self._last_update[endpoint] = 0
+                self._update_lane_statistics(
+                    "status", time.monotonic() - now, 0 if self._is_online else 1
+                )
+
+                if self._is_online:
+                    if self._offline_probes > 0:
+                        self._schedule_catch_up(now)
+
+                    self._offline_probes = 0
+
+                else:
+                    data = PRODUCT_STATUS_OFFLINE_PAYLOAD
+
+                    self._offline_probes += 1
+
+                    self._set_deadline(
+                        status_endpoint, now + self._get_offline_probe_delay()
+                    )
+
+                was_changed = self._set_endpoint_data(status_endpoint, data)
+
+                if self._is_online != was_online:
+                    _LOGGER.debug(f"Device online state changed to {self._is_online}")
 
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
@@ -177,26 +617,57 @@ class RestAPIv2:
         return was_changed
 
     async def update(self, endpoints: list[str] = None):
+        await self.update_status()
+        await self.update_endpoints(endpoints)
+
+    async def update_status(self):
         try:
-            _LOGGER.debug(f"Updating data from {self.config_data.hostname}")
+            _LOGGER.debug(f"Updating status of {self.config_data.hostname}")
+
+            self._update_parsing_mode()
 
             was_changed = await self._update_product_status_endpoint_data()
-            update_counter = 1 if was_changed else 0
+
+            if was_changed:
+                self._extract_data()
+
+                self._update_printer_state()
+
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.error(f"Failed to update status, Error: {ex}, Line: {line_number}")
+
+    async def update_endpoints(self, endpoints: list[str] = None):
+        try:
+            _LOGGER.debug(f"Updating data from {self.config_data.hostname}")
+
+            self._update_parsing_mode()
+
+            update_counter = 0
+            was_stale = self.is_stale
 
             if self._is_online:
                 if endpoints is None:
                     endpoints = self._config_manager.endpoints
 
-                for endpoint in endpoints:
-                    was_updated = await self._update_endpoint_data(endpoint)
+                update_counter = await self._update_endpoints_data(endpoints)
+
+                if was_stale and self._is_snapshot_replaced():
+                    _LOGGER.debug(
+                        f"Live data of {self.config_data.hostname} replaced the snapshot"
+                    )
+
+                    self._snapshot = None
 
-                    if was_updated:
-                        update_counter += 1
+                    # Devices are rebuilt from live data only
+                    self._extraction_cache = {}
 
-            if update_counter > 0:
-                devices = self._get_devices_data()
+            if update_counter > 0 or was_stale != self.is_stale:
+                self._extract_data()
 
-                self._extract_data(devices)
+                self._update_printer_state()
 
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
@@ -204,11 +675,426 @@ class RestAPIv2:
 
             _LOGGER.error(f"Failed to update data, Error: {ex}, Line: {line_number}")
 
-    def _extract_data(self, devices: list[dict]):
+    async def wait_for_events(self) -> list[str] | None:
+        """Long-polls the event table, endpoints named by new events are due right away.
+
+        Returns the endpoints of new events, empty when the table did not change and
+        None once push is not available, interval polling continues meanwhile.
+        """
+        changed_endpoints: list[str] | None = None
+
+        now = time.monotonic()
+
+        try:
+            url = f"{self.config_data.url}{EVENT_TABLE_ENDPOINT}"
+
+            long_poll_timeout = EVENT_TABLE_LONG_POLL_TIMEOUT.total_seconds()
+
+            headers = {}
+            params = {}
+
+            if self._event_table_etag is not None:
+                # Printer holds the request until the table changes, in tenths of a second
+                headers[hdrs.IF_NONE_MATCH] = self._event_table_etag
+                params["timeout"] = int(long_poll_timeout * 10)
+
+            timeout = ClientTimeout(
+                total=long_poll_timeout + REQUEST_TIMEOUT.total_seconds()
+            )
+
+            async with self._session.get(
+                url, headers=headers, params=params, timeout=timeout
+            ) as response:
+                response.raise_for_status()
+
+                etag = response.headers.get(hdrs.ETAG)
+
+                if response.status == 304:
+                    changed_endpoints = []
+
+                elif etag is None:
+                    _LOGGER.info(
+                        f"Event table of {self.config_data.hostname} has no ETag, "
+                        f"it cannot be long-polled"
+                    )
+
+                    await self._config_manager.set_endpoint_unsupported(
+                        EVENT_TABLE_ENDPOINT, datetime.now().timestamp()
+                    )
+
+                else:
+                    content = await response.read()
+                    data = XmlDictConverter.parse(content, IGNORED_KEYS)
+
+                    changed_endpoints = self._set_event_table(etag, data)
+
+                    await self._config_manager.set_endpoint_supported(
+                        EVENT_TABLE_ENDPOINT
+                    )
+
+        except ClientResponseError as cre:
+            if cre.status == 404:
+                _LOGGER.debug(
+                    f"Event table is not available on {self.config_data.hostname}"
+                )
+
+                await self._config_manager.set_endpoint_unsupported(
+                    EVENT_TABLE_ENDPOINT, datetime.now().timestamp()
+                )
+
+            else:
+                _LOGGER.error(f"Failed to wait for events, Error: {cre.status}")
+
+        except TimeoutError:
+            _LOGGER.debug(
+                f"Event table of {self.config_data.hostname} did not respond in time"
+            )
+
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.error(
+                f"Failed to wait for events, Error: {ex}, Line: {line_number}"
+            )
+
+        duration = time.monotonic() - now
+
+        self._update_lane_statistics(
+            "events", duration, 1 if changed_endpoints is None else 0
+        )
+
+        if changed_endpoints is None:
+            self._stop_push()
+
+        else:
+            self._is_push_active = True
+
+            self._set_event_endpoints_due(changed_endpoints)
+
+            min_interval = EVENT_TABLE_MIN_INTERVAL.total_seconds()
+
+            is_long_poll = hdrs.IF_NONE_MATCH in headers
+
+            # Printers ignoring the long-poll timeout must not be polled in a busy loop
+            if is_long_poll and not changed_endpoints and duration < min_interval:
+                self._event_quick_replies += 1
+
+                if self._event_quick_replies >= EVENT_TABLE_MAX_QUICK_REPLIES:
+                    _LOGGER.info(
+                        f"Event table of {self.config_data.hostname} does not hold "
+                        f"long-polls, {self._event_quick_replies} quick replies in a row"
+                    )
+
+                    await self._config_manager.set_endpoint_unsupported(
+                        EVENT_TABLE_ENDPOINT, datetime.now().timestamp()
+                    )
+
+                    self._stop_push()
+
+                    changed_endpoints = None
+
+                else:
+                    await asyncio.sleep(min_interval - duration)
+
+            else:
+                self._event_quick_replies = 0
+
+        return changed_endpoints
+
+    def _set_event_table(self, etag: str, data: dict | None) -> list[str]:
+        event_stamps = self._get_event_stamps(data)
+
+        # First table is the baseline, all endpoints were just polled
+        if self._event_table_etag is None:
+            changed_endpoints = []
+
+        else:
+            changed_endpoints = [
+                endpoint
+                for endpoint in event_stamps
+                if event_stamps[endpoint] != self._event_stamps.get(endpoint)
+            ]
+
+        self._event_table_etag = etag
+        self._event_stamps = event_stamps
+        self._event_endpoints.update(event_stamps)
+
+        if changed_endpoints:
+            _LOGGER.debug(
+                f"Events of {self.config_data.hostname}, "
+                f"Endpoints: {', '.join(changed_endpoints)}"
+            )
+
+        return changed_endpoints
+
+    def _get_event_stamps(self, data: dict | None) -> dict[str, tuple]:
+        events = self._get_data_section(data, ("EventTable", "Event"))
+
+        if not isinstance(events, list):
+            events = [] if events is None else [events]
+
+        event_stamps = {}
+
+        for event in events:
+            if not isinstance(event, dict):
+                continue
+
+            category = event.get("UnqualifiedEventCategory")
+            aging_stamp = event.get("AgingStamp")
+            payloads = event.get("Payload")
+
+            if not isinstance(payloads, list):
+                payloads = [] if payloads is None else [payloads]
+
+            resource_uris = [
+                payload.get("ResourceURI")
+                for payload in payloads
+                if isinstance(payload, dict)
+            ]
+
+            for endpoint in self._config_manager.endpoints:
+                resource_name = endpoint.rsplit("/", 1)[-1].split(".", 1)[0]
+
+                if endpoint in resource_uris or category == resource_name:
+                    stamps = event_stamps.get(endpoint, ())
+
+                    event_stamps[endpoint] = stamps + (aging_stamp,)
+
+        return event_stamps
+
+    def _set_event_endpoints_due(self, endpoints: list[str]):
+        now = time.monotonic()
+
+        for endpoint in endpoints:
+            if endpoint == PRODUCT_STATUS_ENDPOINT:
+                self._deadlines[endpoint] = now
+
+            else:
+                self._set_deadline(endpoint, now)
+
+    def _stop_push(self):
+        was_active = self._is_push_active
+
+        self._is_push_active = False
+        self._event_table_etag = None
+        self._event_quick_replies = 0
+        self._event_stamps = {}
+
+        if was_active:
+            _LOGGER.debug(f"Push of {self.config_data.hostname} stopped")
+
+            now = time.monotonic()
+
+            # Availability is confirmed by the status lane, intervals apply again
+            self._deadlines[PRODUCT_STATUS_ENDPOINT] = now
+
+            self._apply_polling_profile(now)
+
+    def _update_parsing_mode(self):
+        full_documents = self._config_manager.full_documents
+
+        if full_documents != self._full_documents:
+            # Cached payloads were parsed with the other mode
+            self._endpoint_cache.clear()
+            self._full_documents = full_documents
+
+    def _update_lane_statistics(self, lane: str, duration: float, failures: int):
+        lane_statistics = self._lane_statistics.setdefault(
+            lane, {"updates": 0, "failures": 0, "last_duration": 0, "max_duration": 0}
+        )
+
+        lane_statistics["updates"] += 1
+        lane_statistics["failures"] += failures
+        lane_statistics["last_duration"] = round(duration, 3)
+        lane_statistics["max_duration"] = max(
+            lane_statistics["max_duration"], round(duration, 3)
+        )
+
+    def _extract_data(self):
+        changed_device_keys = set()
+
+        for index, data_point_plan in enumerate(self._config_manager.extraction_plan):
+            endpoint = data_point_plan.get("endpoint")
+            version = self._endpoint_versions.get(endpoint, 0)
+
+            extraction = self._extraction_cache.get(index, {})
+
+            if extraction.get("version") == version:
+                continue
+
+            devices = self._get_data_point_devices(data_point_plan)
+
+            # Devices produced before and after, removed keys must be rebuilt as well
+            for device in extraction.get("devices", []) + devices:
+                changed_device_keys.add(device.get("key"))
+
+            self._extraction_cache[index] = {"version": version, "devices": devices}
+
+        if not changed_device_keys:
+            return
+
         device_data = {}
         device_config = {}
 
-        for item in devices:
+        for index in range(len(self._config_manager.extraction_plan)):
+            devices = self._extraction_cache[index].get("devices")
+
+            for device in devices:
+                device_key = device.get("key")
+                item_data = device.get("data")
+                properties = device.get("properties")
+
+                has_data = len(list(item_data.keys())) > 0
+
+                if not has_data:
+                    continue
+
+                if device_key not in changed_device_keys:
+                    if device_key not in device_data:
+                        device_data[device_key] = self._data[device_key]
+                        device_config[device_key] = self._data_config[device_key]
+
+                    continue
+
+                if device_key in device_data:
+                    device_data[device_key].update(item_data)
+                    device_config[device_key]["properties"].update(properties)
+
+                else:
+                    device_data[device_key] = dict(item_data)
+                    device_config[device_key] = {
+                        "device_type": device.get("device_type"),
+                        "properties": dict(properties),
+                    }
+
+        if self._snapshot is not None:
+            self._merge_snapshot(device_data, device_config)
+
+        data_changes = self._get_data_changes(
+            self._data, device_data, changed_device_keys
+        )
+
+        # Changes accumulate until the coordinator notified the entities
+        for device_key in data_changes:
+            device_changes = self._data_changes.setdefault(device_key, set())
+            device_changes.update(data_changes[device_key])
+
+        self._data_config = device_config
+        self._data = device_data
+
+        discovered_device_keys = [
+            device_key
+            for device_key in self._data
+            if device_key in changed_device_keys
+            and device_key not in self._device_dispatched
+        ]
+
+        if discovered_device_keys:
+            self.devices_discovered(discovered_device_keys)
+
+        # Snapshot of live data only, restored values are not persisted again
+        if self._snapshot is None:
+            self._config_manager.set_snapshot(
+                {
+                    "devices": list(self._data.keys()),
+                    "data": self._data,
+                    "config": self._data_config,
+                }
+            )
+
+    def restore_snapshot(self, snapshot: dict) -> dict[str, dict]:
+        """Restore the devices of the last session, served until live data replaced them."""
+        snapshot_data = snapshot.get("data", {})
+        snapshot_config = snapshot.get("config", {})
+
+        device_keys = [
+            device_key
+            for device_key in snapshot.get("devices", [])
+            if device_key in snapshot_data and device_key in snapshot_config
+        ]
+
+        if not device_keys:
+            return {}
+
+        self._snapshot = {
+            "data": {
+                device_key: snapshot_data[device_key] for device_key in device_keys
+            },
+            "config": {
+                device_key: snapshot_config[device_key] for device_key in device_keys
+            },
+        }
+
+        self._data = {
+            device_key: dict(snapshot_data[device_key]) for device_key in device_keys
+        }
+        self._data_config = dict(self._snapshot.get("config"))
+
+        self._device_dispatched.update(device_keys)
+
+        _LOGGER.debug(
+            f"Devices of {self.config_data.hostname} restored, "
+            f"Keys: {', '.join(device_keys)}"
+        )
+
+        devices = self._get_devices(device_keys)
+
+        return devices
+
+    def _merge_snapshot(self, device_data: dict, device_config: dict):
+        snapshot_data = self._snapshot.get("data")
+        snapshot_config = self._snapshot.get("config")
+
+        # Live values override the restored ones, devices not extracted yet are kept
+        for device_key in snapshot_data:
+            if device_key in device_data:
+                device_data[device_key] = {
+                    **snapshot_data[device_key],
+                    **device_data[device_key],
+                }
+
+            else:
+                device_data[device_key] = snapshot_data[device_key]
+                device_config[device_key] = snapshot_config[device_key]
+
+    def _is_snapshot_replaced(self) -> bool:
+        now_ts = datetime.now().timestamp()
+
+        # Every endpoint responded, failures included, or is not supported
+        is_replaced = all(
+            endpoint in self._raw_data
+            or self._config_manager.is_endpoint_unsupported(endpoint, now_ts)
+            for endpoint in self._config_manager.endpoints
+        )
+
+        return is_replaced
+
+    @staticmethod
+    def _get_data_changes(
+        previous_data: dict, data: dict, device_keys: set[str]
+    ) -> dict[str, set[str]]:
+        data_changes = {}
+
+        for device_key in device_keys:
+            previous_device_data = previous_data.get(device_key, {})
+            device_data = data.get(device_key, {})
+
+            keys = {
+                key
+                for key in previous_device_data.keys() | device_data.keys()
+                if previous_device_data.get(key) != device_data.get(key)
+            }
+
+            if keys:
+                data_changes[device_key] = keys
+
+        return data_changes
+
+    def _get_data_point_devices(self, data_point_plan: dict) -> list[dict]:
+        devices = []
+
+        for item in self._get_devices_data(data_point_plan):
             item_config = item.get("config")
             item_data = item.get("data")
 
@@ -250,29 +1136,16 @@ class RestAPIv2:
                 else:
                     device_key = f"{device_type}.{device_id}"
 
-            data = device_data[device_key] if device_key in device_data else {}
-
-            has_data = len(list(item_data.keys())) > 0
-            data.update(item_data)
-
-            if has_data:
-                device_data[device_key] = data
-
-                if device_key in device_config:
-                    config = device_config[device_key]
-                    config["properties"].update(properties)
-
-                else:
-                    device_config[device_key] = {
-                        "device_type": device_type,
-                        "properties": properties,
-                    }
+            device = {
+                "key": device_key,
+                "device_type": device_type,
+                "data": item_data,
+                "properties": properties,
+            }
 
-        self._data_config = device_config
-        self._data = device_data
+            devices.append(device)
 
-        for device_key in self._data:
-            self.device_data_changed(device_key)
+        return devices
 
     @staticmethod
     def _get_device_from_list(
@@ -304,64 +1177,63 @@ class RestAPIv2:
             return None
 
     @staticmethod
-    def _get_data_section(data: dict, path: str) -> dict:
-        path_parts = path.split(".")
+    def _get_data_section(data: dict | list | None, path_parts: tuple[str, ...]):
         result = data
 
-        if result is not None:
-            for path_part in path_parts:
+        for path_part in path_parts:
+            if isinstance(result, dict):
                 result = result.get(path_part)
 
-        return result
+            elif isinstance(result, list) and path_part.isdigit():
+                index = int(path_part)
 
-    def _get_devices_data(self):
-        devices = []
+                result = result[index] if index < len(result) else None
 
-        for data_point in self._config_manager.data_points:
-            endpoint = data_point.get("endpoint")
-            path = data_point.get("path")
-            properties = data_point.get("properties")
+            else:
+                return None
 
-            if endpoint is not None:
-                data_item = self._raw_data.get(endpoint)
+        return result
 
-                data = self._get_data_section(data_item, path)
+    def _get_devices_data(self, data_point_plan: dict) -> list[dict]:
+        endpoint = data_point_plan.get("endpoint")
+        path_parts = data_point_plan.get("path_parts")
 
-                if properties is not None:
-                    if isinstance(data, list):
-                        devices.extend(
-                            [
-                                self._get_device_data(data_item, properties, data_point)
-                                for data_item in data
-                            ]
-                        )
+        data_item = self._raw_data.get(endpoint)
 
-                    else:
-                        device = self._get_device_data(data, properties, data_point)
+        data = self._get_data_section(data_item, path_parts)
 
-                        devices.append(device)
+        if isinstance(data, list):
+            devices = [
+                self._get_device_data(data_item, data_point_plan) for data_item in data
+            ]
+
+        else:
+            devices = [self._get_device_data(data, data_point_plan)]
 
         return devices
 
-    @staticmethod
-    def _get_device_data(
-        data_item: dict, properties: dict, device_config: dict
-    ) -> dict:
+    def _get_device_data(self, data_item: dict | None, data_point_plan: dict) -> dict:
         device_data = {}
 
-        data_item_flat = {} if data_item is None else flatten(data_item, ".")
+        property_plans = data_point_plan.get("properties")
 
-        for property_key in properties:
-            property_details = properties.get(property_key)
-            property_path = property_details.get("path")
-            options = property_details.get("options")
-            validation_warning = property_details.get("validationWarning", False)
-            value = data_item_flat.get(property_path)
+        for property_plan in property_plans:
+            (
+                property_key,
+                path_parts,
+                options,
+                option_set,
+                validation_warning,
+            ) = property_plan
 
-            is_valid = True if options is None else str(value).lower() in options
+            value = self._get_data_section(data_item, path_parts)
+
+            # Same as a lookup in the flattened item, only leaves hold values
+            if isinstance(value, (dict, list)) and value:
+                value = None
 
             if value is not None:
-                if is_valid:
+                if option_set is None or str(value).lower() in option_set:
                     device_data[property_key] = value
                 else:
                     log = _LOGGER.warning if validation_warning else _LOGGER.debug
@@ -370,50 +1242,169 @@ class RestAPIv2:
                         f"Unsupported value of {property_key}, expecting: {options}, received: {value}"
                     )
 
-        data = {"config": device_config, "data": device_data}
+        data = {"config": data_point_plan.get("config"), "data": device_data}
 
         return data
 
+    async def _get_slotted_request(self, endpoint: str) -> dict | None:
+        if self._request_slot is None:
+            return await self._get_request(endpoint)
+
+        # Status keeps a slot of its own next to the endpoints concurrency
+        host_concurrency = self._config_manager.concurrency + 1
+
+        is_status = endpoint == PRODUCT_STATUS_ENDPOINT
+
+        async with self._request_slot(
+            self.config_data.url, host_concurrency, is_status
+        ):
+            return await self._get_request(endpoint)
+
+    async def get_raw_documents(self) -> tuple[dict, list[str]]:
+        """Raw documents for diagnostics, projected ones are requested again in full."""
+        raw_data = dict(self._raw_data)
+
+        if self._full_documents:
+            return raw_data, []
+
+        projected_endpoints = [
+            endpoint
+            for endpoint in raw_data
+            if raw_data[endpoint] is not None
+            and self._config_manager.get_endpoint_projection(endpoint) is not None
+        ]
+
+        if not self._is_online or self._session is None:
+            return raw_data, projected_endpoints
+
+        semaphore = asyncio.Semaphore(self._config_manager.concurrency)
+
+        async def _get_limited_document(endpoint: str) -> dict | None:
+            async with semaphore:
+                return await self._get_full_document(endpoint)
+
+        results = await asyncio.gather(
+            *[_get_limited_document(endpoint) for endpoint in projected_endpoints],
+            return_exceptions=True,
+        )
+
+        for endpoint, result in zip(list(projected_endpoints), results):
+            if isinstance(result, Exception) or result is None:
+                _LOGGER.warning(
+                    f"Failed to get full document of {endpoint}, "
+                    f"diagnostics keep the projected one, Error: {result}"
+                )
+
+                continue
+
+            raw_data[endpoint] = result
+
+            projected_endpoints.remove(endpoint)
+
+        return raw_data, projected_endpoints
+
+    async def _get_full_document(self, endpoint: str) -> dict | None:
+        # Caches and statistics are left untouched, it's not part of polling
+        if self._request_slot is None:
+            return await self._get_document(endpoint)
+
+        host_concurrency = self._config_manager.concurrency + 1
+
+        async with self._request_slot(self.config_data.url, host_concurrency):
+            return await self._get_document(endpoint)
+
+    async def _get_document(self, endpoint: str) -> dict | None:
+        url = f"{self.config_data.url}{endpoint}"
+        timeout = ClientTimeout(total=self._get_timeout(endpoint))
+
+        async with self._session.get(url, timeout=timeout) as response:
+            response.raise_for_status()
+
+            content = await response.read()
+
+            result = self._parse_content(response.content_type, content, None)
+
+        return result
+
     async def _get_request(self, endpoint: str) -> dict | None:
         result: dict | None = None
-        start_ts = datetime.now().timestamp()
+
+        # Latency is learned on the monotonic clock, wall clock jumps do not skew it
+        start = time.monotonic()
 
         try:
             url = f"{self.config_data.url}{endpoint}"
 
-            timeout = ClientTimeout(total=5)
+            timeout = ClientTimeout(total=self._get_timeout(endpoint))
+            headers = self._get_conditional_headers(endpoint)
+            endpoint_cache = self._endpoint_cache.get(endpoint, {})
+            projection = (
+                None
+                if self._full_documents
+                else self._config_manager.get_endpoint_projection(endpoint)
+            )
 
             async with self._session.get(
-                url, timeout=timeout, verify_ssl=False
+                url, headers=headers, timeout=timeout
             ) as response:
                 response.raise_for_status()
 
-                if response.content_type == "application/javascript":
-                    content = await response.text()
-                    result = json.loads(content)
+                if response.status == 304:
+                    result = endpoint_cache.get("data")
+
+                    self._update_endpoint_statistics(endpoint, "not_modified")
+
+                    _LOGGER.debug(f"Request to {url} not modified, using cached data")
 
                 else:
-                    content = await response.text()
-                    result = self._clean_data(content)
+                    is_streamed = (
+                        self._config_manager.streaming
+                        and response.content_type != JSON_CONTENT_TYPE
+                    )
 
-                    if result is not None:
-                        result_keys = list(result.keys())
-                        root_key = result_keys[0]
+                    if is_streamed:
+                        payload_hash, result = await self._read_streamed_xml(
+                            response, projection
+                        )
+
+                    else:
+                        content = await response.read()
+                        payload_hash = self._get_payload_hash(content)
 
-                        for ignored_key in IGNORED_KEYS:
-                            if ignored_key in result[root_key]:
-                                del result[root_key][ignored_key]
+                    if payload_hash == endpoint_cache.get("hash"):
+                        result = endpoint_cache.get("data")
 
-                completed_ts = datetime.now().timestamp()
-                time_taken = completed_ts - start_ts
+                        self._update_endpoint_statistics(endpoint, "unchanged")
+
+                        _LOGGER.debug(f"Request to {url} unchanged, using cached data")
+
+                    else:
+                        if not is_streamed:
+                            result = self._parse_content(
+                                response.content_type, content, projection
+                            )
+
+                        self._update_endpoint_statistics(endpoint, "changed")
+
+                    self._update_endpoint_cache(
+                        endpoint, response, payload_hash, result
+                    )
+
+                await self._config_manager.set_endpoint_supported(endpoint)
+
+                time_taken = time.monotonic() - start
                 _LOGGER.debug(f"Request to {url} completed, Time: {time_taken:.3f}s")
 
+                self._add_endpoint_latency(endpoint, time_taken)
+
         except ClientResponseError as cre:
+            self._add_endpoint_latency(endpoint, time.monotonic() - start)
+
             if cre.status == 404:
                 exc_type, exc_obj, tb = sys.exc_info()
                 line_number = tb.tb_lineno
                 completed_ts = datetime.now().timestamp()
-                time_taken = completed_ts - start_ts
+                time_taken = time.monotonic() - start
 
                 _LOGGER.debug(
                     f"Failed to get response from {endpoint}, "
@@ -422,11 +1413,16 @@ class RestAPIv2:
                     f"Time: {time_taken:.3f}s"
                 )
 
+                # Product status is the online indicator, it's never skipped
+                if endpoint != PRODUCT_STATUS_ENDPOINT:
+                    await self._config_manager.set_endpoint_unsupported(
+                        endpoint, completed_ts
+                    )
+
             else:
                 exc_type, exc_obj, tb = sys.exc_info()
                 line_number = tb.tb_lineno
-                completed_ts = datetime.now().timestamp()
-                time_taken = completed_ts - start_ts
+                time_taken = time.monotonic() - start
 
                 _LOGGER.error(
                     f"Failed to get response from {endpoint}, "
@@ -436,14 +1432,14 @@ class RestAPIv2:
                 )
 
         except TimeoutError:
+            # Not a latency sample, it would ratchet the timeout up to its maximum
             _LOGGER.error(f"Failed to get {endpoint} due to timeout")
 
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
             line_number = tb.tb_lineno
 
-            completed_ts = datetime.now().timestamp()
-            time_taken = completed_ts - start_ts
+            time_taken = time.monotonic() - start
 
             _LOGGER.error(
                 f"Failed to get {endpoint}, "
@@ -454,42 +1450,136 @@ class RestAPIv2:
 
         return result
 
-    def _clean_data(self, xml) -> dict:
-        xml_data = ElementTree.fromstring(xml)
+    def _add_endpoint_latency(self, endpoint: str, latency: float):
+        if endpoint not in self._endpoint_latencies:
+            self._endpoint_latencies[endpoint] = deque(maxlen=REQUEST_LATENCY_SAMPLES)
 
-        self._strip_namespace(xml_data)
+        self._endpoint_latencies[endpoint].append(latency)
 
-        data = xmltodict.parse(ElementTree.tostring(xml_data))
+    def _get_latency_percentile(self, endpoint: str) -> float | None:
+        latencies = self._endpoint_latencies.get(endpoint)
 
-        return data
-
-    def _strip_namespace(self, el):
-        if el.tag.startswith("{"):
-            el.tag = el.tag.split("}", 1)[1]
+        if latencies is None or len(latencies) < REQUEST_LATENCY_MIN_SAMPLES:
+            return None
 
-        keys = list(el.attrib.keys())
+        sorted_latencies = sorted(latencies)
+        index = math.ceil(len(sorted_latencies) * REQUEST_TIMEOUT_PERCENTILE) - 1
 
-        for k in keys:
-            if k.startswith("{"):
-                k2 = k.split("}", 1)[1]
-                el.attrib[k2] = el.attrib[k]
-                del el.attrib[k]
+        latency_percentile = round(sorted_latencies[index], 3)
 
-        for child in el:
-            self._strip_namespace(child)
+        return latency_percentile
 
-    def device_data_changed(self, device_key: str):
-        device_data = self._data.get(device_key)
-        device_config = self._data_config.get(device_key)
+    def _get_timeout(self, endpoint: str) -> float:
+        latency_percentile = self._get_latency_percentile(endpoint)
 
-        if device_key not in self._device_dispatched:
-            self._device_dispatched.append(device_key)
+        if latency_percentile is None:
+            timeout = REQUEST_TIMEOUT.total_seconds()
 
-            dispatcher_send(
-                self._hass,
-                SIGNAL_HA_DEVICE_DISCOVERED,
-                self._config_manager.entry_id,
-                device_key,
-                device_data,
-                device_config,
+        else:
+            timeout = min(
+                max(
+                    latency_percentile * REQUEST_TIMEOUT_FACTOR,
+                    REQUEST_TIMEOUT_MIN.total_seconds(),
+                ),
+                REQUEST_TIMEOUT_MAX.total_seconds(),
             )
+
+        return round(timeout, 3)
+
+    def _get_conditional_headers(self, endpoint: str) -> dict[str, str]:
+        headers = {}
+        endpoint_cache = self._endpoint_cache.get(endpoint)
+
+        if endpoint_cache is not None:
+            etag = endpoint_cache.get("etag")
+            last_modified = endpoint_cache.get("last_modified")
+
+            if etag is not None:
+                headers[hdrs.IF_NONE_MATCH] = etag
+
+            if last_modified is not None:
+                headers[hdrs.IF_MODIFIED_SINCE] = last_modified
+
+        return headers
+
+    def _update_endpoint_cache(
+        self,
+        endpoint: str,
+        response: ClientResponse,
+        payload_hash: str,
+        data: dict | None,
+    ):
+        if data is None:
+            self._endpoint_cache.pop(endpoint, None)
+
+        else:
+            self._endpoint_cache[endpoint] = {
+                "etag": response.headers.get(hdrs.ETAG),
+                "last_modified": response.headers.get(hdrs.LAST_MODIFIED),
+                "hash": payload_hash,
+                "data": data,
+            }
+
+    def _update_endpoint_statistics(self, endpoint: str, result_type: str):
+        endpoint_statistics = self._endpoint_statistics.setdefault(endpoint, {})
+
+        endpoint_statistics[result_type] = endpoint_statistics.get(result_type, 0) + 1
+
+    @staticmethod
+    def _get_payload_hash(content: bytes) -> str:
+        payload_hash = hashlib.blake2b(content, digest_size=16).hexdigest()
+
+        return payload_hash
+
+    @staticmethod
+    async def _read_streamed_xml(
+        response: ClientResponse, projection: dict | None
+    ) -> tuple[str, dict | None]:
+        hasher = hashlib.blake2b(digest_size=16)
+        parser = XmlDictConverter.create_parser(IGNORED_KEYS, projection)
+
+        # Parsing overlaps with the network wait, no full body buffer is kept,
+        # the result is dropped by the caller when the hash matches the cached one
+        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+            hasher.update(chunk)
+            parser.feed(chunk)
+
+        result = parser.close()
+
+        return hasher.hexdigest(), result
+
+    @staticmethod
+    def _parse_content(
+        content_type: str, content: bytes, projection: dict | None
+    ) -> dict | None:
+        if content_type == JSON_CONTENT_TYPE:
+            result = json.loads(content)
+
+        else:
+            result = XmlDictConverter.parse(content, IGNORED_KEYS, projection)
+
+        return result
+
+    def _get_devices(self, device_keys: list[str]) -> dict[str, dict]:
+        devices = {
+            device_key: {
+                "data": self._data.get(device_key),
+                "config": self._data_config.get(device_key),
+            }
+            for device_key in device_keys
+        }
+
+        return devices
+
+    def devices_discovered(self, device_keys: list[str]):
+        # One signal per extraction cycle, devices are created and added together
+        devices = self._get_devices(device_keys)
+
+        self._device_dispatched.update(device_keys)
+
+        dispatcher_send(
+            self._hass,
+            SIGNAL_HA_DEVICES_DISCOVERED,
+            self._config_manager.entry_id,
+            devices,
+        )
@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from datetime import datetime
 import logging
 
@@ -43,32 +44,62 @@ class HASensorEntity(BaseEntity, SensorEntity):
             entity_description.native_unit_of_measurement
         )
 
+        self._value_converters = self._get_value_converters(entity_description)
+        self._state: str | None = None
+        self._attr_native_value = None
+
         self._set_value()
 
-    def _set_value(self):
-        state = self.get_value()
+        self._written_state = self._get_state()
+
+    @staticmethod
+    def _get_value_converters(
+        entity_description: IntegrationSensorEntityDescription,
+    ) -> list[Callable]:
+        value_converters = []
 
-        if state is not None:
-            if self.native_unit_of_measurement in [PERCENTAGE]:
-                state = float(state)
+        unit_of_measurement = entity_description.native_unit_of_measurement
+        device_class = entity_description.device_class
 
-            elif self.native_unit_of_measurement in NUMERIC_UNITS_OF_MEASUREMENT:
-                state = int(state)
+        if unit_of_measurement in [PERCENTAGE]:
+            value_converters.append(float)
 
-            if self.device_class == SensorDeviceClass.DATE:
-                state = datetime.fromisoformat(state)
+        elif unit_of_measurement in NUMERIC_UNITS_OF_MEASUREMENT:
+            value_converters.append(int)
 
-            elif self.device_class == SensorDeviceClass.TIMESTAMP:
-                tz = datetime.now().astimezone().tzinfo
-                ts = datetime.fromisoformat(state).timestamp()
-                state = datetime.fromtimestamp(ts, tz=tz)
+        if device_class == SensorDeviceClass.DATE:
+            value_converters.append(datetime.fromisoformat)
 
-            elif self.device_class == SensorDeviceClass.ENUM:
-                state = state.lower()
+        elif device_class == SensorDeviceClass.TIMESTAMP:
+            value_converters.append(HASensorEntity._convert_timestamp)
 
-        self._attr_native_value = state
+        elif device_class == SensorDeviceClass.ENUM:
+            value_converters.append(str.lower)
 
-    def _handle_coordinator_update(self) -> None:
-        """Fetch new state parameters for the sensor."""
-        self._set_value()
-        super()._handle_coordinator_update()
+        return value_converters
+
+    @staticmethod
+    def _convert_timestamp(state: str) -> datetime:
+        tz = datetime.now().astimezone().tzinfo
+        ts = datetime.fromisoformat(state).timestamp()
+
+        return datetime.fromtimestamp(ts, tz=tz)
+
+    def _set_value(self):
+        state = self.get_value()
+
+        # Raw strings such as manufacturing dates rarely change, keep their conversion
+        if state == self._state:
+            return
+
+        value = state
+
+        if value is not None:
+            for value_converter in self._value_converters:
+                value = value_converter(value)
+
+        self._state = state
+        self._attr_native_value = value
+
+    def _get_state(self) -> tuple:
+        return *super()._get_state(), self._attr_native_value
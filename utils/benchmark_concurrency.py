@@ -0,0 +1,89 @@
+import asyncio
+import logging
+import sys
+import time
+
+from custom_components.hpprinter import HAConfigManager
+from custom_components.hpprinter.common.consts import PRODUCT_STATUS_ENDPOINT
+from custom_components.hpprinter.managers.rest_api import RestAPIv2
+from homeassistant.const import CONF_HOST, CONF_PORT, CONF_SSL
+from homeassistant.core import HomeAssistant
+from utils.stand_in_server import StandInPrinter
+
+root = logging.getLogger()
+root.setLevel(logging.WARNING)
+
+stream_handler = logging.StreamHandler(sys.stdout)
+formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+stream_handler.setFormatter(formatter)
+root.addHandler(stream_handler)
+
+_LOGGER = logging.getLogger(__name__)
+
+LATENCIES = {
+    PRODUCT_STATUS_ENDPOINT: 0.2,
+    "/DevMgmt/ProductConfigDyn.xml": 1.0,
+    "/DevMgmt/ConsumableConfigDyn.xml": 1.5,
+    "/DevMgmt/ProductUsageDyn.xml": 2.0,
+    "/DevMgmt/NetAppsSecureDyn.xml": 0.6,
+    "/IoMgmt/Adapters": 0.5,
+    "/ePrint/ePrintConfigDyn.xml": 0.8,
+}
+
+CONCURRENCY_LEVELS = [1, 2, 3, 7]
+
+
+async def _measure_cold_cycle(hass, port: int, concurrency: int) -> float:
+    config_manager = HAConfigManager(None, None)
+    await config_manager.initialize(
+        {CONF_HOST: "127.0.0.1", CONF_PORT: port, CONF_SSL: False}
+    )
+    await config_manager.set_concurrency(concurrency)
+
+    api = RestAPIv2(hass, config_manager)
+    await api.initialize()
+
+    start_ts = time.perf_counter()
+
+    await api.update()
+
+    time_taken = time.perf_counter() - start_ts
+
+    await api.terminate()
+
+    return time_taken
+
+
+async def main():
+    hass = HomeAssistant(".")
+
+    printer = StandInPrinter(LATENCIES)
+    await printer.start()
+
+    endpoints_latencies = [
+        LATENCIES[endpoint]
+        for endpoint in LATENCIES
+        if endpoint != PRODUCT_STATUS_ENDPOINT
+    ]
+
+    print(f"Sum of endpoint latencies: {sum(endpoints_latencies):.3f}s")
+    print(f"Max of endpoint latencies: {max(endpoints_latencies):.3f}s")
+
+    try:
+        for concurrency in CONCURRENCY_LEVELS:
+            time_taken = await _measure_cold_cycle(hass, printer.port, concurrency)
+
+            print(f"Concurrency: {concurrency}, Cold cycle: {time_taken:.3f}s")
+
+    finally:
+        await printer.stop()
+
+
+if __name__ == "__main__":
+    loop = asyncio.new_event_loop()
+
+    try:
+        loop.run_until_complete(main())
+
+    except KeyboardInterrupt:
+        _LOGGER.info("Aborted")
@@ -0,0 +1,132 @@
+import asyncio
+import os
+import timeit
+
+from flatten_json import flatten
+
+from custom_components.hpprinter import HAConfigManager
+from custom_components.hpprinter.common.consts import IGNORED_KEYS
+from custom_components.hpprinter.common.xml_converter import XmlDictConverter
+from custom_components.hpprinter.managers.rest_api import RestAPIv2
+from utils.stand_in_server import ENDPOINT_PAYLOADS, PAYLOADS_DIRECTORY
+
+ITERATIONS = 1000
+
+
+def _get_data_section_legacy(data: dict, path: str) -> dict:
+    path_parts = path.split(".")
+    result = data
+
+    if result is not None:
+        for path_part in path_parts:
+            result = result.get(path_part)
+
+    return result
+
+
+def _get_device_data_legacy(
+    data_item: dict, properties: dict, device_config: dict
+) -> dict:
+    device_data = {}
+
+    data_item_flat = {} if data_item is None else flatten(data_item, ".")
+
+    for property_key in properties:
+        property_details = properties.get(property_key)
+        property_path = property_details.get("path")
+        options = property_details.get("options")
+        value = data_item_flat.get(property_path)
+
+        is_valid = True if options is None else str(value).lower() in options
+
+        if value is not None and is_valid:
+            device_data[property_key] = value
+
+    data = {"config": device_config, "data": device_data}
+
+    return data
+
+
+def get_devices_data_legacy(data_points: list[dict], raw_data: dict) -> list[dict]:
+    """Previous extraction: flatten every device item, then look up the paths."""
+    devices = []
+
+    for data_point in data_points:
+        endpoint = data_point.get("endpoint")
+        path = data_point.get("path")
+        properties = data_point.get("properties")
+
+        if endpoint is not None:
+            data_item = raw_data.get(endpoint)
+
+            data = _get_data_section_legacy(data_item, path)
+
+            if properties is not None:
+                if isinstance(data, list):
+                    devices.extend(
+                        [
+                            _get_device_data_legacy(data_item, properties, data_point)
+                            for data_item in data
+                        ]
+                    )
+
+                else:
+                    device = _get_device_data_legacy(data, properties, data_point)
+
+                    devices.append(device)
+
+    return devices
+
+
+def _load_raw_data() -> dict:
+    raw_data = {}
+
+    for endpoint in ENDPOINT_PAYLOADS:
+        file_path = os.path.join(PAYLOADS_DIRECTORY, ENDPOINT_PAYLOADS[endpoint])
+
+        with open(file_path, "rb") as file:
+            raw_data[endpoint] = XmlDictConverter.parse(file.read(), IGNORED_KEYS)
+
+    return raw_data
+
+
+async def main():
+    config_manager = HAConfigManager(None, None)
+    await config_manager.initialize({})
+
+    api = RestAPIv2(None, config_manager)
+    api._raw_data = _load_raw_data()
+
+    data_points = config_manager.data_points
+    extraction_plan = config_manager.extraction_plan
+
+    def get_devices_data_compiled() -> list[dict]:
+        devices = []
+
+        for data_point_plan in extraction_plan:
+            devices.extend(api._get_devices_data(data_point_plan))
+
+        return devices
+
+    if (
+        get_devices_data_legacy(data_points, api.raw_data)
+        != get_devices_data_compiled()
+    ):
+        raise ValueError("Extraction output differs")
+
+    time_legacy = timeit.timeit(
+        lambda: get_devices_data_legacy(data_points, api.raw_data), number=ITERATIONS
+    )
+    time_compiled = timeit.timeit(get_devices_data_compiled, number=ITERATIONS)
+
+    print(
+        f"Extraction per cycle - "
+        f"Legacy: {time_legacy * 1000 / ITERATIONS:.3f}ms, "
+        f"Compiled: {time_compiled * 1000 / ITERATIONS:.3f}ms, "
+        f"Speedup: {time_legacy / time_compiled:.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(main())
@@ -0,0 +1,102 @@
+import asyncio
+import json
+import time
+import timeit
+
+from custom_components.hpprinter import HAConfigManager
+from custom_components.hpprinter.common.consts import COMPILED_PARAMETERS_FILE
+from custom_components.hpprinter.common.parameter_type import ParameterType
+
+ITERATIONS = 200
+
+
+def _get_parameters_content() -> dict:
+    parameters_content = {}
+
+    for parameter_type in ParameterType:
+        file_path = HAConfigManager._get_parameters_path(parameter_type)
+
+        with open(file_path, "rb") as file:
+            parameters_content[parameter_type] = file.read()
+
+    return parameters_content
+
+
+def _get_compiled_content() -> bytes:
+    file_path = HAConfigManager._get_parameters_path(COMPILED_PARAMETERS_FILE)
+
+    with open(file_path, "rb") as file:
+        content = file.read()
+
+    return content
+
+
+async def _load_parameters(compiled: bool) -> float:
+    """Cold load of the parameters, as done by the first entry on startup."""
+    config_manager = HAConfigManager(None, None)
+
+    if not compiled:
+
+        async def get_compiled_parameters_file():
+            return None
+
+        config_manager._get_compiled_parameters_file = get_compiled_parameters_file
+
+    HAConfigManager._parameters_configuration = None
+
+    start = time.perf_counter()
+
+    await config_manager._load_parameters_configuration()
+
+    return time.perf_counter() - start
+
+
+async def main():
+    parameters_content = _get_parameters_content()
+    compiled_content = _get_compiled_content()
+
+    compiled_parameters = json.loads(compiled_content)
+
+    if compiled_parameters.get("source_hash") != HAConfigManager.get_parameters_hash(
+        parameters_content
+    ):
+        raise ValueError("Compiled parameters are stale, run compile_data_points.py")
+
+    config_manager = HAConfigManager(None, None)
+
+    def load_source():
+        config_manager._load_compiled_parameters(
+            HAConfigManager.compile_parameters(parameters_content)
+        )
+
+    def load_compiled():
+        config_manager._load_compiled_parameters(json.loads(compiled_content))
+
+    time_source = timeit.timeit(load_source, number=ITERATIONS)
+    time_compiled = timeit.timeit(load_compiled, number=ITERATIONS)
+
+    print(
+        f"Parameters build - "
+        f"Source: {time_source * 1000 / ITERATIONS:.3f}ms, "
+        f"Compiled: {time_compiled * 1000 / ITERATIONS:.3f}ms, "
+        f"Speedup: {time_source / time_compiled:.2f}x"
+    )
+
+    load_time_source = 0
+    load_time_compiled = 0
+
+    for _ in range(ITERATIONS):
+        load_time_source += await _load_parameters(False)
+        load_time_compiled += await _load_parameters(True)
+
+    print(
+        f"Parameters load, including file access - "
+        f"Source: {load_time_source * 1000 / ITERATIONS:.3f}ms, "
+        f"Compiled: {load_time_compiled * 1000 / ITERATIONS:.3f}ms, "
+        f"Speedup: {load_time_source / load_time_compiled:.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(main())
@@ -0,0 +1,114 @@
+import asyncio
+import os
+import timeit
+
+from defusedxml import ElementTree
+import xmltodict
+
+from custom_components.hpprinter import HAConfigManager
+from custom_components.hpprinter.common.consts import IGNORED_KEYS
+from custom_components.hpprinter.common.xml_converter import XmlDictConverter
+from utils.stand_in_server import ENDPOINT_PAYLOADS, PAYLOADS_DIRECTORY
+
+ITERATIONS = 500
+
+
+def _strip_namespace(el):
+    if el.tag.startswith("{"):
+        el.tag = el.tag.split("}", 1)[1]
+
+    keys = list(el.attrib.keys())
+
+    for k in keys:
+        if k.startswith("{"):
+            k2 = k.split("}", 1)[1]
+            el.attrib[k2] = el.attrib[k]
+            del el.attrib[k]
+
+    for child in el:
+        _strip_namespace(child)
+
+
+def parse_legacy(content: bytes) -> dict:
+    """Previous pipeline: parse, strip namespaces, serialize and parse again."""
+    xml_data = ElementTree.fromstring(content)
+
+    _strip_namespace(xml_data)
+
+    result = xmltodict.parse(ElementTree.tostring(xml_data))
+
+    result_keys = list(result.keys())
+    root_key = result_keys[0]
+
+    for ignored_key in IGNORED_KEYS:
+        if ignored_key in result[root_key]:
+            del result[root_key][ignored_key]
+
+    return result
+
+
+def parse_single_pass(content: bytes) -> dict:
+    result = XmlDictConverter.parse(content, IGNORED_KEYS)
+
+    return result
+
+
+def parse_projected(content: bytes, projection: dict | None) -> dict:
+    result = XmlDictConverter.parse(content, IGNORED_KEYS, projection)
+
+    return result
+
+
+async def main():
+    config_manager = HAConfigManager(None, None)
+    await config_manager.initialize({})
+
+    total_legacy = 0
+    total_single_pass = 0
+    total_projected = 0
+
+    for endpoint in ENDPOINT_PAYLOADS:
+        file_name = ENDPOINT_PAYLOADS[endpoint]
+        file_path = os.path.join(PAYLOADS_DIRECTORY, file_name)
+        projection = config_manager.get_endpoint_projection(endpoint)
+
+        with open(file_path, "rb") as file:
+            content = file.read()
+
+        if parse_legacy(content) != parse_single_pass(content):
+            raise ValueError(f"Converters output differs for {file_name}")
+
+        time_legacy = timeit.timeit(lambda: parse_legacy(content), number=ITERATIONS)
+        time_single_pass = timeit.timeit(
+            lambda: parse_single_pass(content), number=ITERATIONS
+        )
+        time_projected = timeit.timeit(
+            lambda: parse_projected(content, projection), number=ITERATIONS
+        )
+
+        total_legacy += time_legacy
+        total_single_pass += time_single_pass
+        total_projected += time_projected
+
+        print(
+            f"{file_name}: "
+            f"Legacy: {time_legacy * 1000 / ITERATIONS:.3f}ms, "
+            f"Single pass: {time_single_pass * 1000 / ITERATIONS:.3f}ms, "
+            f"Projected: {time_projected * 1000 / ITERATIONS:.3f}ms, "
+            f"Speedup: {time_legacy / time_single_pass:.2f}x / "
+            f"{time_legacy / time_projected:.2f}x"
+        )
+
+    print(
+        f"Total - "
+        f"Legacy: {total_legacy * 1000 / ITERATIONS:.3f}ms, "
+        f"Single pass: {total_single_pass * 1000 / ITERATIONS:.3f}ms, "
+        f"Projected: {total_projected * 1000 / ITERATIONS:.3f}ms, "
+        f"Speedup: {total_legacy / total_single_pass:.2f}x / "
+        f"{total_legacy / total_projected:.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(main())
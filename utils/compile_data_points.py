@@ -0,0 +1,190 @@
+import json
+import logging
+import os
+import sys
+
+from custom_components.hpprinter import HAConfigManager
+from custom_components.hpprinter.common.consts import (
+    COMPILED_PARAMETERS_FILE,
+    DURATION_UNITS,
+)
+from custom_components.hpprinter.common.parameter_type import ParameterType
+from homeassistant.const import Platform
+
+DEBUG = str(os.environ.get("DEBUG", False)).lower() == str(True).lower()
+
+log_level = logging.DEBUG if DEBUG else logging.INFO
+
+root = logging.getLogger()
+root.setLevel(log_level)
+
+stream_handler = logging.StreamHandler(sys.stdout)
+stream_handler.setLevel(log_level)
+formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+stream_handler.setFormatter(formatter)
+root.addHandler(stream_handler)
+
+_LOGGER = logging.getLogger(__name__)
+
+REQUIRED_DATA_POINT_KEYS = ["name", "endpoint", "path", "device_type", "properties"]
+SUPPORTED_PLATFORMS = [str(Platform.SENSOR), str(Platform.BINARY_SENSOR)]
+
+
+def _is_valid_duration(duration) -> bool:
+    if duration is None or isinstance(duration, (int, float)):
+        return True
+
+    if not isinstance(duration, str):
+        return False
+
+    unit_keys = [key for key in DURATION_UNITS if duration.endswith(key)]
+
+    if not unit_keys:
+        return False
+
+    try:
+        float(duration[: -len(unit_keys[0])])
+
+    except ValueError:
+        return False
+
+    return True
+
+
+def _validate_property(name: str, property_key: str, property_data: dict) -> list:
+    errors = []
+    prefix = f"{name}.{property_key}"
+
+    if not isinstance(property_data.get("path"), str):
+        errors.append(f"{prefix}: path is missing")
+
+    platform = property_data.get("platform")
+
+    if platform is not None and platform not in SUPPORTED_PLATFORMS:
+        errors.append(f"{prefix}: unsupported platform {platform}")
+
+    for list_key in ["options", "on_values"]:
+        values = property_data.get(list_key)
+
+        if values is not None and not (
+            isinstance(values, list) and all(isinstance(value, str) for value in values)
+        ):
+            errors.append(f"{prefix}: {list_key} must be a list of strings")
+
+    exclude = property_data.get("exclude")
+
+    if exclude is not None and not isinstance(exclude, dict):
+        errors.append(f"{prefix}: exclude must be an object")
+
+    return errors
+
+
+def _validate_endpoint_profiles(data_points: list) -> list[str]:
+    errors = []
+    endpoint_profiles = {}
+
+    for data_point_index, data_point in enumerate(data_points):
+        name = data_point.get("name", f"#{data_point_index}")
+        endpoint = data_point.get("endpoint")
+        profiles = data_point.get("profiles", {})
+
+        if not isinstance(profiles, dict):
+            errors.append(f"{name}: profiles must be an object")
+
+            continue
+
+        merged_profiles = endpoint_profiles.setdefault(endpoint, {})
+
+        for state in profiles:
+            if state not in merged_profiles:
+                merged_profiles[state] = (name, profiles[state])
+
+                continue
+
+            other_name, other_interval = merged_profiles[state]
+
+            if other_interval != profiles[state]:
+                errors.append(
+                    f"{name}: {state} interval {profiles[state]} conflicts with "
+                    f"{other_interval} of {other_name} for endpoint {endpoint}"
+                )
+
+    return errors
+
+
+def validate_data_points(data_points: list) -> list[str]:
+    errors = []
+
+    if not isinstance(data_points, list):
+        return ["data points must be a list"]
+
+    errors.extend(_validate_endpoint_profiles(data_points))
+
+    for data_point_index, data_point in enumerate(data_points):
+        name = data_point.get("name", f"#{data_point_index}")
+
+        for key in REQUIRED_DATA_POINT_KEYS:
+            if key not in data_point:
+                errors.append(f"{name}: {key} is missing")
+
+        if not _is_valid_duration(data_point.get("interval")):
+            errors.append(f"{name}: invalid interval {data_point.get('interval')}")
+
+        profiles = data_point.get("profiles", {})
+
+        for state in profiles:
+            if not _is_valid_duration(profiles[state]):
+                errors.append(f"{name}: invalid {state} interval {profiles[state]}")
+
+        properties = data_point.get("properties")
+
+        if not isinstance(properties, dict):
+            errors.append(f"{name}: properties must be an object")
+
+            continue
+
+        for property_key in properties:
+            errors.extend(
+                _validate_property(name, property_key, properties[property_key])
+            )
+
+    return errors
+
+
+def main() -> int:
+    parameters_content = {}
+
+    for parameter_type in ParameterType:
+        file_path = HAConfigManager._get_parameters_path(parameter_type)
+
+        with open(file_path, "rb") as file:
+            parameters_content[parameter_type] = file.read()
+
+    data_points = json.loads(parameters_content[ParameterType.DATA_POINTS])
+
+    errors = validate_data_points(data_points)
+
+    for error in errors:
+        _LOGGER.error(f"Invalid {ParameterType.DATA_POINTS}, {error}")
+
+    if errors:
+        return 1
+
+    compiled_parameters = HAConfigManager.compile_parameters(parameters_content)
+
+    output_path = HAConfigManager._get_parameters_path(COMPILED_PARAMETERS_FILE)
+
+    with open(output_path, "w") as file:
+        file.write(json.dumps(compiled_parameters, separators=(",", ":")))
+        file.write("\n")
+
+    _LOGGER.info(
+        f"Compiled {len(data_points)} data points into {output_path}, "
+        f"Source: {compiled_parameters.get('source_hash')}"
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
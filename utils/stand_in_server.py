@@ -0,0 +1,190 @@
+import asyncio
+from email.utils import formatdate
+import hashlib
+import logging
+import os
+from pathlib import Path
+
+from aiohttp import web
+
+_LOGGER = logging.getLogger(__name__)
+
+PAYLOADS_DIRECTORY = os.path.join(Path(__file__).parent, "payloads")
+
+DEFAULT_LATENCY = 0.0
+
+EVENT_TABLE_ENDPOINT = "/EventMgmt/EventTable"
+
+ENDPOINT_PAYLOADS = {
+    "/DevMgmt/ProductConfigDyn.xml": "DevMgmt_ProductConfigDyn.xml",
+    "/DevMgmt/ProductStatusDyn.xml": "DevMgmt_ProductStatusDyn.xml",
+    "/DevMgmt/ConsumableConfigDyn.xml": "DevMgmt_ConsumableConfigDyn.xml",
+    "/DevMgmt/ProductUsageDyn.xml": "DevMgmt_ProductUsageDyn.xml",
+    "/DevMgmt/NetAppsSecureDyn.xml": "DevMgmt_NetAppsSecureDyn.xml",
+    "/IoMgmt/Adapters": "IoMgmt_Adapters.xml",
+    "/ePrint/ePrintConfigDyn.xml": "ePrint_ePrintConfigDyn.xml",
+}
+
+
+class StandInPrinter:
+    """Slow local stand-in of an HP printer EWS, serving the recorded payloads."""
+
+    def __init__(
+        self,
+        latencies: dict[str, float] | None = None,
+        default_latency: float = DEFAULT_LATENCY,
+        emit_validators: bool = False,
+        event_table: bool = False,
+    ):
+        self._latencies = {} if latencies is None else latencies
+        self._default_latency = default_latency
+        self._emit_validators = emit_validators
+        self._last_modified = formatdate(usegmt=True)
+        self._event_table = event_table
+
+        self._events: dict[str, int] = {}
+        self._events_version = 0
+        self._events_changed: asyncio.Event | None = None
+
+        self._payloads = self._load_payloads()
+        self._requests: dict[str, int] = {}
+
+        self._runner: web.AppRunner | None = None
+        self._port: int | None = None
+
+    @property
+    def port(self) -> int | None:
+        return self._port
+
+    @property
+    def endpoints(self) -> list[str]:
+        return list(self._payloads.keys())
+
+    @property
+    def requests(self) -> dict[str, int]:
+        return self._requests
+
+    @staticmethod
+    def _load_payloads() -> dict[str, bytes]:
+        payloads = {}
+
+        for endpoint in ENDPOINT_PAYLOADS:
+            file_path = os.path.join(PAYLOADS_DIRECTORY, ENDPOINT_PAYLOADS[endpoint])
+
+            with open(file_path, "rb") as file:
+                payloads[endpoint] = file.read()
+
+        return payloads
+
+    def set_payload(self, endpoint: str, content: bytes):
+        self._payloads[endpoint] = content
+        self._last_modified = formatdate(usegmt=True)
+
+        self._events_version += 1
+        self._events[endpoint] = self._events_version
+
+        # Wakes the held long-polls, later ones wait for the next change
+        if self._events_changed is not None:
+            self._events_changed.set()
+            self._events_changed = asyncio.Event()
+
+    def _get_event_table(self) -> bytes:
+        events = [
+            "<ev:Event>"
+            f"<dd:UnqualifiedEventCategory>"
+            f"{endpoint.rsplit('/', 1)[-1].split('.', 1)[0]}"
+            f"</dd:UnqualifiedEventCategory>"
+            f"<dd:AgingStamp>{self._events[endpoint]}</dd:AgingStamp>"
+            f"<ev:Payload><dd:ResourceURI>{endpoint}</dd:ResourceURI></ev:Payload>"
+            "</ev:Event>"
+            for endpoint in self._events
+        ]
+
+        content = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<ev:EventTable xmlns:ev="http://www.hp.com/schemas/imaging/con/ledm/events/2007/09/16" '
+            'xmlns:dd="http://www.hp.com/schemas/imaging/con/dictionaries/1.0/">'
+            f"{''.join(events)}"
+            "</ev:EventTable>"
+        )
+
+        return content.encode()
+
+    async def _handle_event_table(self, request: web.Request) -> web.Response:
+        etag = f'"{self._events_version}"'
+
+        if request.headers.get("If-None-Match") == etag:
+            # Long-poll, held until the table changes or the timeout in tenths of a second
+            timeout = int(request.query.get("timeout", 0)) / 10
+
+            try:
+                await asyncio.wait_for(self._events_changed.wait(), timeout)
+
+            except TimeoutError:
+                return web.Response(status=304, headers={"ETag": etag})
+
+            etag = f'"{self._events_version}"'
+
+        return web.Response(
+            body=self._get_event_table(),
+            content_type="text/xml",
+            headers={"ETag": etag},
+        )
+
+    def get_latency(self, endpoint: str) -> float:
+        latency = self._latencies.get(endpoint, self._default_latency)
+
+        return latency
+
+    async def _handle_request(self, request: web.Request) -> web.Response:
+        endpoint = request.path
+
+        self._requests[endpoint] = self._requests.get(endpoint, 0) + 1
+
+        if endpoint == EVENT_TABLE_ENDPOINT and self._event_table:
+            return await self._handle_event_table(request)
+
+        await asyncio.sleep(self.get_latency(endpoint))
+
+        content = self._payloads.get(endpoint)
+
+        if content is None:
+            raise web.HTTPNotFound()
+
+        headers = {}
+
+        if self._emit_validators:
+            etag = f'"{hashlib.sha256(content).hexdigest()[:16]}"'
+
+            headers = {"ETag": etag, "Last-Modified": self._last_modified}
+
+            if request.headers.get("If-None-Match") == etag:
+                return web.Response(status=304, headers=headers)
+
+        return web.Response(body=content, content_type="text/xml", headers=headers)
+
+    async def start(self):
+        self._events_changed = asyncio.Event()
+
+        app = web.Application()
+        app.router.add_get("/{tail:.*}", self._handle_request)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+
+        self._port = self._runner.addresses[0][1]
+
+        _LOGGER.info(f"Stand-in printer listening on port {self._port}")
+
+    async def stop(self):
+        # Held long-polls are answered, the runner waits for pending handlers
+        if self._events_changed is not None:
+            self._events_changed.set()
+
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+            self._runner = None